@@ -0,0 +1,134 @@
+"""Per-operation cost of InMemoryPetRepositoryAdapter as the store grows.
+
+Writes the latency of create, get_by_id, get_all, update and delete as JSON,
+in the format of users_app/benchmarks/repository_benchmark.py, whose compare
+mode checks these results for regressions too. PetRepositoryPort has no
+count operation, so it is not measured.
+
+Usage:
+    PYTHONPATH=src python benchmarks/repository_benchmark.py \\
+        --sizes 1000 100000 1000000 --output current.json
+"""
+
+import argparse
+import gc
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List
+
+from adapters.memory.pet_repository_adapter import InMemoryPetRepositoryAdapter
+from domain.models.pet import Pet, PetType
+
+OPERATIONS = ("create", "get_by_id", "get_all", "update", "delete")
+# get_all recorre todo el store: se mide menos veces
+GET_ALL_RUNS = 3
+
+
+def build_pet(i: int) -> Pet:
+    return Pet(name=f"Pet {i}", type=PetType.DOG, age=i % 15 + 1, owner_name="Ana")
+
+
+def summarize(samples_ns: List[int]) -> dict:
+    samples = sorted(samples_ns)
+    return {
+        "ops": len(samples),
+        "mean_us": round(sum(samples) / len(samples) / 1000, 3),
+        "p50_us": round(samples[len(samples) // 2] / 1000, 3),
+        "p95_us": round(
+            samples[min(len(samples) - 1, len(samples) * 95 // 100)] / 1000, 3
+        ),
+    }
+
+
+def timed(call: Callable, args_list) -> List[int]:
+    samples = []
+    # Como timeit: sin pausas del recolector dentro de la medición
+    gc.disable()
+    try:
+        for args in args_list:
+            start = time.perf_counter_ns()
+            call(*args)
+            samples.append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+    return samples
+
+
+def measure(size: int, sample: int, operations) -> Dict[str, dict]:
+    """Fill the store up to `size` pets and time `sample` calls per operation."""
+    # El store vive en la clase: se reemplaza para empezar vacío
+    InMemoryPetRepositoryAdapter.memory_store = {}
+    repository = InMemoryPetRepositoryAdapter()
+    for i in range(size):
+        repository.create(build_pet(i))
+    rng = random.Random(size)
+    results = {}
+
+    # La secuencia es len(store) + 1: se borra en orden inverso al de creación
+    # para que el tamaño y los IDs vuelvan a quedar como estaban
+    created = []
+    samples = timed(
+        lambda p: created.append(repository.create(p)),
+        [(build_pet(i),) for i in range(size, size + sample)],
+    )
+    if "create" in operations:
+        results["create"] = summarize(samples)
+    if "get_by_id" in operations:
+        lookups = [(rng.randint(1, size),) for _ in range(sample)]
+        results["get_by_id"] = summarize(timed(repository.get_by_id, lookups))
+    if "update" in operations:
+        pets = [repository.get_by_id(rng.randint(1, size)) for _ in range(sample)]
+        results["update"] = summarize(timed(repository.update, [(p,) for p in pets]))
+    if "get_all" in operations:
+        results["get_all"] = summarize(timed(repository.get_all, [()] * GET_ALL_RUNS))
+    samples = timed(repository.delete, [(p.id,) for p in reversed(created)])
+    if "delete" in operations:
+        results["delete"] = summarize(samples)
+    InMemoryPetRepositoryAdapter.memory_store = {}
+    return results
+
+
+def run(args) -> dict:
+    results = {}
+    for size in args.sizes:
+        for operation, stats in measure(size, args.sample, args.operations).items():
+            results[f"pets.memory.{size}.{operation}"] = stats
+            print(
+                f"{size:>9} {operation:>10}: {stats['p50_us']:10.2f} us p50",
+                file=sys.stderr,
+            )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sample": args.sample,
+        },
+        "results": results,
+    }
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    parser.add_argument(
+        "--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS)
+    )
+    parser.add_argument("--sample", type=int, default=1000, help="Calls per operation")
+    parser.add_argument("--output", help="JSON file for the results (default stdout)")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    text = json.dumps(run(args), indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text)
+    else:
+        print(text)
@@ -0,0 +1,49 @@
+from typing import List, Optional
+
+from prometheus_client import Histogram
+
+from domain.models.pet import Pet
+from domain.ports.pet_repository_port import PetRepositoryPort
+
+REPOSITORY_LATENCY = Histogram(
+    "pets_repository_operation_seconds",
+    "Latency of pet repository operations.",
+    ["backend", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class InstrumentedPetRepository(PetRepositoryPort):
+    """Records the latency of every operation of another pet repository."""
+
+    def __init__(self, repository: PetRepositoryPort, backend: str):
+        self.repository = repository
+        self.backend = backend
+
+    def _timer(self, operation: str):
+        return REPOSITORY_LATENCY.labels(self.backend, operation).time()
+
+    def create(self, pet: Pet) -> Pet:
+        """Create a new pet."""
+        with self._timer("create"):
+            return self.repository.create(pet)
+
+    def get_by_id(self, pet_id: int) -> Optional[Pet]:
+        """Get pet by ID."""
+        with self._timer("get_by_id"):
+            return self.repository.get_by_id(pet_id)
+
+    def get_all(self) -> List[Pet]:
+        """Get all pets."""
+        with self._timer("get_all"):
+            return self.repository.get_all()
+
+    def update(self, pet: Pet) -> Pet:
+        """Update an existing pet."""
+        with self._timer("update"):
+            return self.repository.update(pet)
+
+    def delete(self, pet_id: int) -> Pet:
+        """Delete a pet."""
+        with self._timer("delete"):
+            return self.repository.delete(pet_id)
@@ -1,4 +1,6 @@
+from adapters.instrumented.pet_repository_adapter import InstrumentedPetRepository
 from adapters.memory.pet_repository_adapter import InMemoryPetRepositoryAdapter
+from domain.ports.pet_repository_port import PetRepositoryPort
 from domain.use_cases.base_use_case import BaseUseCase
 from domain.use_cases.create_pet_use_case import CreatePetUseCase
 from domain.use_cases.delete_pet_use_case import DeletePetUseCase
@@ -6,7 +8,9 @@ from domain.use_cases.get_pet_use_case import GetPetUseCase
 from domain.use_cases.get_pets_use_case import GetAllPetsUseCase
 from domain.use_cases.update_pet_use_case import UpdatePetUseCase
 
-repository: InMemoryPetRepositoryAdapter = InMemoryPetRepositoryAdapter()
+repository: PetRepositoryPort = InstrumentedPetRepository(
+    InMemoryPetRepositoryAdapter(), "memory"
+)
 
 
 def build_create_pet_use_case() -> BaseUseCase:
@@ -16,3 +16,10 @@ class Settings:
     @lru_cache()
     def log_level(self) -> str:
         return os.getenv("LOG_LEVEL", "DEBUG")
+
+    @classmethod
+    @property
+    @lru_cache()
+    def fast_json_responses(self) -> bool:
+        """Serialize responses with orjson and precompiled list serializers."""
+        return os.getenv("FAST_JSON_RESPONSES", "false").lower() == "true"
@@ -1,7 +1,11 @@
 from fastapi import FastAPI
 
 from config import Settings
+from entrypoints.api.metrics import MetricsMiddleware
+from entrypoints.api.metrics import router as metrics_router
 from entrypoints.api.routers.pet_router import router as pet_router
 
 app = FastAPI(title=Settings.app_name)
 app.include_router(pet_router)
+app.include_router(metrics_router)
+app.add_middleware(MetricsMiddleware)
@@ -0,0 +1,35 @@
+import json
+from typing import Any, List
+
+from fastapi.responses import JSONResponse
+from pydantic import TypeAdapter
+
+from config import Settings
+from domain.models.pet import Pet
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+# Serializador compilado una sola vez: dump_json no revalida las mascotas,
+# que ya fueron validadas al entrar al repositorio
+pet_list_serializer = TypeAdapter(List[Pet])
+
+# Clase de respuesta de las rutas; FAST_JSON_RESPONSES=true activa orjson
+DefaultJSONResponse = FastJSONResponse if Settings.fast_json_responses else JSONResponse
@@ -1,7 +1,7 @@
 from typing import List
 
 from fastapi import APIRouter, Depends, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, Response
 
 from assembly import (
     build_create_pet_use_case,
@@ -10,11 +10,13 @@ from assembly import (
     build_get_pets_use_case,
     build_update_pet_use_case,
 )
+from config import Settings
 from domain.models.pet import Pet
 from domain.use_cases.base_use_case import BaseUseCase
+from entrypoints.api.responses import DefaultJSONResponse, pet_list_serializer
 from errors import PetNotFoundError
 
-router = APIRouter(prefix="/pets")
+router = APIRouter(prefix="/pets", default_response_class=DefaultJSONResponse)
 
 
 @router.get("/ping", response_class=PlainTextResponse)
@@ -41,7 +43,13 @@ def get_pet(pet_id: int, use_case: BaseUseCase = Depends(build_get_pet_use_case)
 @router.get("/", response_model=List[Pet])
 def get_pets(use_case: BaseUseCase = Depends(build_get_pets_use_case)):
     """Get all pets."""
-    return use_case.execute()
+    pets = use_case.execute()
+    if Settings.fast_json_responses:
+        # Sin revalidar con response_model
+        return Response(
+            pet_list_serializer.dump_json(pets), media_type="application/json"
+        )
+    return pets
 
 
 @router.put("/{pet_id}", response_model=Pet)
@@ -0,0 +1,21 @@
+from fastapi.testclient import TestClient
+
+from entrypoints.api.main import app
+
+
+def test_metrics_are_labelled_by_route_template(valid_pet_data):
+    """Test the request histogram, the repository timings and the threadpool."""
+    client = TestClient(app)
+    pet = client.post("/pets/", json={**valid_pet_data, "type": "dog"}).json()
+    client.get(f"/pets/{pet['id']}")
+
+    body = client.get("/metrics").text
+
+    assert 'route="/pets/{pet_id}",status="200"' in body
+    assert f'route="/pets/{pet["id"]}"' not in body
+    assert (
+        'pets_repository_operation_seconds_count{backend="memory",operation="get_by_id"}'
+        in body
+    )
+    assert "threadpool_threads_busy" in body
+    assert "http_requests_in_flight" in body
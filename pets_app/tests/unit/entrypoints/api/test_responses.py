@@ -0,0 +1,20 @@
+import json
+
+from domain.models.pet import Pet
+from entrypoints.api.responses import FastJSONResponse, pet_list_serializer
+
+
+def test_pet_list_serializer_matches_model_dump(pet_with_id):
+    """Test that the precompiled serializer emits what response_model would."""
+    pets = [pet_with_id, Pet(id=2, name="Michi", type="cat", age=1, owner_name="Ana")]
+
+    body = pet_list_serializer.dump_json(pets)
+
+    assert json.loads(body) == [pet.model_dump(mode="json") for pet in pets]
+
+
+def test_fast_json_response_renders_compact_json():
+    """Test the orjson response class."""
+    response = FastJSONResponse({"id": 1, "name": "Ñandú"})
+
+    assert json.loads(response.body) == {"id": 1, "name": "Ñandú"}
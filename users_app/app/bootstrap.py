@@ -0,0 +1,11 @@
+"""Create the database schema, e.g. from a deploy or migration job.
+
+Usage:
+    python -m app.bootstrap
+"""
+
+from . import models
+from .database import engine
+
+if __name__ == "__main__":
+    models.Base.metadata.create_all(bind=engine)
@@ -1,20 +1,58 @@
-from fastapi import FastAPI
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Request, Response, status
+from fastapi.responses import JSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, REGISTRY, generate_latest
 from . import models
-from .database import engine
+from .database import SessionLocal, engine
 from .routers import users
+from .utils import security
+from .utils.hashing import HashingPoolSaturatedError, hashing_pool
+from .utils.sessions import SessionSweeper
+
+# Purga periódica de sesiones vencidas (SESSION_SWEEP_* en el entorno)
+session_sweeper = SessionSweeper(SessionLocal)
 
-# Crea las tablas en la base de datos al iniciar la aplicación
-models.Base.metadata.create_all(bind=engine)
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Un pod mal configurado no arranca, en vez de responder 500 en cada login
+    security.check_token_config()
+    # Las tablas se crean al arrancar, no al importar; con DB_CREATE_SCHEMA=false
+    # queda a cargo de `python -m app.bootstrap` (job de despliegue/migración)
+    if os.getenv("DB_CREATE_SCHEMA", "true").lower() == "true":
+        models.Base.metadata.create_all(bind=engine)
+    # Calibra el costo de bcrypt para el CPU disponible en este pod
+    security.configure_rounds()
+    session_sweeper.start()
+    yield
+    await session_sweeper.stop()
+    hashing_pool.shutdown()
 
 app = FastAPI(
     title="Users Service API",
     description="API for managing users in the cloud application project.",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # Incluir el router de usuarios
 app.include_router(users.router)
 
+@app.exception_handler(HashingPoolSaturatedError)
+async def hashing_pool_saturated_handler(request: Request, exc: HashingPoolSaturatedError):
+    # Rechazo rápido: mejor un 503 inmediato que encolar más trabajo de bcrypt
+    return JSONResponse(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        content={"detail": "Service busy, try again later"},
+        headers={"Retry-After": "1"},
+    )
+
 @app.get("/")
 def root():
     return {"message": "Welcome to the Users Service"}
+
+@app.get("/metrics", include_in_schema=False)
+def metrics():
+    # Formato Prometheus: pool de hashing y barrido de sesiones
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, DateTime, func
+from sqlalchemy import Column, String, DateTime, ForeignKey, func
 from sqlalchemy.dialects.postgresql import UUID
 import uuid
 from .database import Base
@@ -19,3 +19,15 @@ class User(Base):
     expireAt = Column(DateTime, nullable=True)
     createdAt = Column(DateTime, server_default=func.now())
     updatedAt = Column(DateTime, server_default=func.now(), onupdate=func.now())
+
+class UserSession(Base):
+    """Sesión abierta por un login; un usuario puede tener varias a la vez."""
+    __tablename__ = "sessions"
+
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4)
+    # Sólo se guarda el hash del token; el índice único resuelve /me en una búsqueda
+    tokenHash = Column(String(64), unique=True, index=True, nullable=False)
+    userId = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), index=True, nullable=False)
+    # Índice para purgar las sesiones vencidas sin recorrer toda la tabla
+    expireAt = Column(DateTime, index=True, nullable=False)
+    createdAt = Column(DateTime, server_default=func.now())
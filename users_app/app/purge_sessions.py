@@ -0,0 +1,18 @@
+"""Delete the expired sessions, e.g. from a cron job.
+
+Usage:
+    python -m app.purge_sessions [batch_size]
+"""
+
+import sys
+
+from .database import SessionLocal
+from .utils.sessions import PURGE_BATCH_SIZE, purge_expired_sessions
+
+if __name__ == "__main__":
+    batch_size = int(sys.argv[1]) if len(sys.argv) > 1 else PURGE_BATCH_SIZE
+    db = SessionLocal()
+    try:
+        print(f"{purge_expired_sessions(db, batch_size)} expired sessions deleted")
+    finally:
+        db.close()
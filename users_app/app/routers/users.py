@@ -1,30 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Header
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Header
+from fastapi.concurrency import run_in_threadpool
+from sqlalchemy import func, text
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 import uuid
 
 from .. import models, schemas
-from ..database import get_db
+from ..database import SessionLocal, get_db
 from ..utils import security
+from ..utils.hashing import HashingPoolSaturatedError, hashing_pool
 
 router = APIRouter(
     prefix="/users",
     tags=["users"]
 )
 
+# Los handlers async sólo esperan a bcrypt en el event loop; las llamadas a la
+# sesión (síncrona) van al threadpool a través de estas funciones
+def find_user(db: Session, *conditions) -> Optional[models.User]:
+    return db.query(models.User).filter(*conditions).first()
+
+def save(db: Session, instance, refresh: bool = False):
+    db.add(instance)
+    db.commit()
+    if refresh:
+        db.refresh(instance)
+    return instance
+
 # 1. Creación de usuarios
 @router.post("", status_code=status.HTTP_201_CREATED, response_model=schemas.UserCreatedResponse)
-def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
+async def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
     # Verificar si el username o email ya existen
-    existing_user = db.query(models.User).filter(
-        (models.User.username == user.username) | (models.User.email == user.email)
-    ).first()
+    existing_user = await run_in_threadpool(
+        find_user, db, (models.User.username == user.username) | (models.User.email == user.email)
+    )
     if existing_user:
         raise HTTPException(status_code=status.HTTP_412_PRECONDITION_FAILED, detail="Username or email already exists")
 
     salt = security.get_salt()
-    hashed_password = security.hash_password(user.password, salt)
+    # bcrypt corre en el pool de procesos para no bloquear el event loop
+    hashed_password = await hashing_pool.run(security.hash_password, user.password, salt)
 
     new_user = models.User(
         username=user.username,
@@ -35,10 +51,7 @@ def create_user(user: schemas.UserCreate, db: Session = Depends(get_db)):
         dni=user.dni,
         phoneNumber=user.phoneNumber
     )
-    db.add(new_user)
-    db.commit()
-    db.refresh(new_user)
-    return new_user
+    return await run_in_threadpool(save, db, new_user, True)
 
 # 2. Actualización de usuarios
 @router.patch("/{user_id}", status_code=status.HTTP_200_OK)
@@ -57,10 +70,31 @@ def update_user(user_id: uuid.UUID, user_update: schemas.UserUpdate, db: Session
     db.commit()
     return {"msg": "el usuario ha sido actualizado"}
 
+def store_password(user_id: uuid.UUID, hashed_password: str, salt: str):
+    """Guarda el nuevo hash en una sesión propia."""
+    # Corre después de la respuesta: la sesión de la petición ya se cerró
+    db = SessionLocal()
+    try:
+        db.query(models.User).filter(models.User.id == user_id).update(
+            {"password": hashed_password, "salt": salt}, synchronize_session=False
+        )
+        db.commit()
+    finally:
+        db.close()
+
+async def rehash_password(user_id: uuid.UUID, plain_password: str):
+    """Rehashea la contraseña con el costo de bcrypt vigente."""
+    salt = security.get_salt()
+    try:
+        hashed_password = await hashing_pool.run(security.hash_password, plain_password, salt)
+    except HashingPoolSaturatedError:
+        return  # Se reintentará en el próximo login
+    await run_in_threadpool(store_password, user_id, hashed_password, salt.decode('utf-8'))
+
 # 3. Generación de token
 @router.post("/auth", response_model=schemas.Token)
-def login_for_token(user_credentials: schemas.UserLogin, db: Session = Depends(get_db)):
-    user = db.query(models.User).filter(models.User.username == user_credentials.username).first()
+async def login_for_token(user_credentials: schemas.UserLogin, background_tasks: BackgroundTasks, db: Session = Depends(get_db)):
+    user = await run_in_threadpool(find_user, db, models.User.username == user_credentials.username)
     
     if not user:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invalid credentials")
@@ -68,16 +102,26 @@ def login_for_token(user_credentials: schemas.UserLogin, db: Session = Depends(g
     # La sal se guardó como string, hay que codificarla de nuevo a bytes
     salt_bytes = user.salt.encode('utf-8')
     
-    if not security.verify_password(user_credentials.password, user.password, salt_bytes):
+    if not await hashing_pool.run(security.verify_password, user_credentials.password, user.password, salt_bytes):
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Invalid credentials")
 
+    if security.needs_rehash(user.password):
+        # Hash con un costo menor al vigente: se actualiza después de responder
+        background_tasks.add_task(rehash_password, user.id, user_credentials.password)
+
+    if security.TOKEN_MODE == "signed":
+        # El token se valida sin estado, no hace falta escribir en la base de datos
+        token, expire_at = security.generate_signed_token(user.id)
+        return {"id": user.id, "token": token, "expireAt": expire_at}
+
+    # Cada login abre una sesión nueva; la fila del usuario no se modifica.
+    # El id se lee antes del commit, que expira el objeto y lo recargaría aquí
+    user_id = user.id
     token, expire_at = security.generate_token()
-    user.token = token
-    user.expireAt = expire_at
-    db.commit()
-    db.refresh(user)
+    session = models.UserSession(userId=user_id, tokenHash=security.hash_token(token), expireAt=expire_at)
+    await run_in_threadpool(save, db, session)
 
-    return {"id": user.id, "token": token, "expireAt": expire_at}
+    return {"id": user_id, "token": token, "expireAt": expire_at}
 
 # 4. Consultar información del usuario
 @router.get("/me", response_model=schemas.UserOut)
@@ -92,9 +136,27 @@ def read_users_me(authorization: Optional[str] = Header(None), db: Session = Dep
     except ValueError:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Invalid authorization header format")
 
-    user = db.query(models.User).filter(models.User.token == token).first()
+    if security.TOKEN_MODE == "signed":
+        user_id = security.verify_signed_token(token)
+        if user_id is None:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+        user = db.get(models.User, user_id)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
+        return user
+
+    # Una búsqueda por el índice único de tokenHash, unida al usuario
+    user = (
+        db.query(models.User)
+        .join(models.UserSession, models.UserSession.userId == models.User.id)
+        .filter(
+            models.UserSession.tokenHash == security.hash_token(token),
+            models.UserSession.expireAt >= datetime.utcnow(),
+        )
+        .first()
+    )
 
-    if not user or user.expireAt < datetime.utcnow():
+    if not user:
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid or expired token")
 
     return user
@@ -102,7 +164,8 @@ def read_users_me(authorization: Optional[str] = Header(None), db: Session = Dep
 # 5. Consultar cantidad de entidades
 @router.get("/count", response_model=dict)
 def get_user_count(db: Session = Depends(get_db)):
-    count = db.query(models.User).count()
+    # COUNT directo sobre la tabla, sin la subconsulta que genera Query.count()
+    count = db.query(func.count(models.User.id)).scalar()
     return {"count": count}
 
 # 6. Consulta de salud del servicio
@@ -113,6 +176,13 @@ def ping():
 # 7. Restablecer base de datos
 @router.post("/reset", status_code=status.HTTP_200_OK)
 def reset_database(db: Session = Depends(get_db)):
-    db.query(models.User).delete()
+    if db.get_bind().dialect.name == "postgresql":
+        # TRUNCATE vacía la tabla en tiempo constante, sin borrar fila a fila
+        db.execute(text(
+            f"TRUNCATE TABLE {models.UserSession.__tablename__}, {models.User.__tablename__}"
+        ))
+    else:
+        db.query(models.UserSession).delete()
+        db.query(models.User).delete()
     db.commit()
     return {"msg": "Todos los datos fueron eliminados"}
@@ -0,0 +1,83 @@
+import asyncio
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Optional
+
+from prometheus_client import Counter, Gauge, Histogram
+
+# Métricas del pool, expuestas en /metrics
+QUEUE_DEPTH = Gauge("hashing_pool_queue_depth", "Hashes queued or running in the pool.")
+WAIT_SECONDS = Histogram("hashing_pool_wait_seconds", "Time a hash waited for a free worker.")
+HASH_SECONDS = Histogram("hashing_pool_hash_seconds", "Time a worker spent hashing.")
+REJECTED = Counter("hashing_pool_rejected", "Hashes rejected because the pool was saturated.")
+
+def _timed(fn: Callable, *args):
+    """Corre en el worker: mide sólo el hash, sin la espera en la cola."""
+    start = time.perf_counter()
+    result = fn(*args)
+    return result, time.perf_counter() - start
+
+class HashingPoolSaturatedError(Exception):
+    """Se lanza cuando la cola del pool de hashing está llena."""
+    pass
+
+class HashingPool:
+    """Ejecuta bcrypt en un pool de procesos para no bloquear a los workers.
+
+    Las llamadas pendientes (en cola o en ejecución) están acotadas por
+    `max_pending`; al superarlo se rechaza la llamada de inmediato en lugar
+    de encolarla, para que el servicio responda 503 rápido.
+    """
+
+    def __init__(self, workers: int, max_pending: int):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._pending = 0
+        self._calls = 0
+        self._rejected = 0
+
+    async def run(self, fn: Callable, *args):
+        """Ejecuta `fn(*args)` en el pool y espera su resultado."""
+        # Solo se llama desde el event loop, por lo que los contadores no necesitan lock
+        if self._pending >= self.max_pending:
+            self._rejected += 1
+            REJECTED.inc()
+            raise HashingPoolSaturatedError("Hashing pool saturated")
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+        self._pending += 1
+        QUEUE_DEPTH.inc()
+        start = time.perf_counter()
+        try:
+            result, hash_seconds = await asyncio.get_running_loop().run_in_executor(
+                self._executor, _timed, fn, *args
+            )
+        finally:
+            self._pending -= 1
+            self._calls += 1
+            QUEUE_DEPTH.dec()
+        HASH_SECONDS.observe(hash_seconds)
+        WAIT_SECONDS.observe(max(time.perf_counter() - start - hash_seconds, 0.0))
+        return result
+
+    def stats(self) -> dict:
+        """Profundidad de la cola y llamadas; las latencias están en /metrics."""
+        return {
+            "workers": self.workers,
+            "queue_depth": self._pending,
+            "max_pending": self.max_pending,
+            "calls": self._calls,
+            "rejected": self._rejected,
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+hashing_pool = HashingPool(
+    workers=int(os.getenv("HASHING_WORKERS", "1")),
+    max_pending=int(os.getenv("HASHING_MAX_PENDING", "16")),
+)
@@ -1,10 +1,54 @@
+import base64
 import bcrypt
+import hashlib
+import hmac
+import os
+import time
 import uuid
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from typing import Optional
+
+# "database": token opaco con su sesión guardada en la tabla sessions.
+# "signed": token firmado con HMAC que lleva el id del usuario y su expiración.
+TOKEN_MODE = os.getenv("TOKEN_MODE", "database")
+TOKEN_SECRET = os.getenv("TOKEN_SECRET", "")
+
+# Costo de bcrypt. Si BCRYPT_ROUNDS no está definido se calibra al arrancar
+# (ver configure_rounds) para que un hash tome a lo sumo BCRYPT_TARGET_MS.
+BCRYPT_ROUNDS = int(os.getenv("BCRYPT_ROUNDS", "12"))
+BCRYPT_TARGET_MS = float(os.getenv("BCRYPT_TARGET_MS", "250"))
+BCRYPT_MIN_ROUNDS = int(os.getenv("BCRYPT_MIN_ROUNDS", "10"))
+BCRYPT_MAX_ROUNDS = int(os.getenv("BCRYPT_MAX_ROUNDS", "15"))
+
+def calibrate_rounds(target_ms: float, min_rounds: int, max_rounds: int, probe_rounds: int = 8) -> int:
+    """Calcula el mayor costo cuyo hash tarda menos de `target_ms` en este hardware."""
+    # Cada ronda adicional duplica el tiempo, así que basta con medir un costo bajo
+    start = time.perf_counter()
+    bcrypt.hashpw(b"calibration", bcrypt.gensalt(rounds=probe_rounds))
+    probe_ms = (time.perf_counter() - start) * 1000
+    rounds = probe_rounds
+    while rounds < max_rounds and probe_ms * 2 ** (rounds + 1 - probe_rounds) <= target_ms:
+        rounds += 1
+    while rounds > min_rounds and probe_ms * 2 ** (rounds - probe_rounds) > target_ms:
+        rounds -= 1
+    return min(max(rounds, min_rounds), max_rounds)
+
+def configure_rounds() -> int:
+    """Fija BCRYPT_ROUNDS: el valor explícito del entorno o uno calibrado."""
+    global BCRYPT_ROUNDS
+    if "BCRYPT_ROUNDS" not in os.environ:
+        BCRYPT_ROUNDS = calibrate_rounds(BCRYPT_TARGET_MS, BCRYPT_MIN_ROUNDS, BCRYPT_MAX_ROUNDS)
+    return BCRYPT_ROUNDS
 
 def get_salt() -> bytes:
     """Genera una nueva sal."""
-    return bcrypt.gensalt()
+    return bcrypt.gensalt(rounds=BCRYPT_ROUNDS)
+
+def needs_rehash(hashed_password: str) -> bool:
+    """Indica si el hash se generó con un costo menor al actual."""
+    # Formato bcrypt: $2b$<costo>$<sal+hash>. Sólo se sube el costo: cada pod
+    # calibra el suyo, y un pod más lento no debe bajar los hashes de otro
+    return int(hashed_password.split('$')[2]) < BCRYPT_ROUNDS
 
 def hash_password(password: str, salt: bytes) -> str:
     """Hashea una contraseña usando una sal proporcionada."""
@@ -24,3 +68,39 @@ def generate_token() -> (str, datetime):
     token = str(uuid.uuid4())
     expire_at = datetime.utcnow() + timedelta(hours=1) # Token válido por 1 hora
     return token, expire_at
+
+def hash_token(token: str) -> str:
+    """Hash del token con el que se guarda y se busca la sesión."""
+    # El token es aleatorio: basta un SHA-256, sin sal ni costo como bcrypt
+    return hashlib.sha256(token.encode('utf-8')).hexdigest()
+
+def check_token_config():
+    """Falla al arrancar si el modo firmado no tiene secreto."""
+    if TOKEN_MODE == "signed" and not TOKEN_SECRET:
+        raise RuntimeError("TOKEN_SECRET es obligatorio con TOKEN_MODE=signed")
+
+def _sign(payload: str) -> str:
+    if not TOKEN_SECRET:
+        raise RuntimeError("TOKEN_SECRET es obligatorio con TOKEN_MODE=signed")
+    digest = hmac.new(TOKEN_SECRET.encode('utf-8'), payload.encode('utf-8'), hashlib.sha256).digest()
+    return base64.urlsafe_b64encode(digest).rstrip(b'=').decode('ascii')
+
+def generate_signed_token(user_id: uuid.UUID) -> (str, datetime):
+    """Genera un token firmado con el id del usuario y su fecha de expiración."""
+    expire_at = datetime.now(timezone.utc).replace(microsecond=0) + timedelta(hours=1)
+    payload = f"{user_id.hex}.{int(expire_at.timestamp())}"
+    return f"{payload}.{_sign(payload)}", expire_at.replace(tzinfo=None)
+
+def verify_signed_token(token: str) -> Optional[uuid.UUID]:
+    """Valida la firma y la expiración de un token; retorna el id del usuario."""
+    payload, _, signature = token.rpartition('.')
+    # compare_digest rechaza str con caracteres no ASCII: se comparan bytes
+    if not hmac.compare_digest(signature.encode('utf-8'), _sign(payload).encode('ascii')):
+        return None
+    user_id, _, expire_at = payload.partition('.')
+    try:
+        if int(expire_at) <= datetime.now(timezone.utc).timestamp():
+            return None
+        return uuid.UUID(hex=user_id)
+    except ValueError:
+        return None
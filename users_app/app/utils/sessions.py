@@ -0,0 +1,153 @@
+import asyncio
+import logging
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Callable, Optional
+
+from prometheus_client import Counter, Histogram
+from sqlalchemy import delete, select
+from sqlalchemy.orm import Session
+
+from .. import models
+
+logger = logging.getLogger(__name__)
+
+# Métricas del barrido, expuestas en /metrics para ajustar el intervalo y los lotes
+SWEEP_SECONDS = Histogram("session_sweep_duration_seconds", "Duration of a session sweep run.")
+SWEEP_RECLAIMED = Counter("session_sweep_reclaimed", "Expired sessions deleted by the sweeper.")
+SWEEP_ERRORS = Counter("session_sweep_errors", "Session sweep runs that failed.")
+
+PURGE_BATCH_SIZE = int(os.getenv("SESSION_SWEEP_BATCH_SIZE", "1000"))
+# Tope de lotes por pasada: lo que quede se borra en la siguiente
+SWEEP_MAX_BATCHES = int(os.getenv("SESSION_SWEEP_MAX_BATCHES", "10"))
+SWEEP_INTERVAL_SECONDS = float(os.getenv("SESSION_SWEEP_INTERVAL_SECONDS", "60"))
+
+def purge_expired_sessions(
+    db: Session,
+    batch_size: int = PURGE_BATCH_SIZE,
+    now: Optional[datetime] = None,
+    max_batches: Optional[int] = None,
+) -> int:
+    """Borra las sesiones vencidas por lotes; retorna cuántas se borraron.
+
+    Sólo toca la tabla sessions: la tabla users no se bloquea. Cada lote es
+    una transacción corta, y en Postgres las filas que otra transacción tiene
+    tomadas se saltan (SKIP LOCKED) en vez de esperarlas.
+    """
+    if batch_size < 1:
+        raise ValueError("batch_size debe ser al menos 1")
+    now = now or datetime.utcnow()
+    purged = 0
+    batches = 0
+    while max_batches is None or batches < max_batches:
+        batches += 1
+        # Los ids salen del índice de expireAt
+        expired = (
+            select(models.UserSession.id)
+            .where(models.UserSession.expireAt < now)
+            .limit(batch_size)
+            .with_for_update(skip_locked=True)
+        )
+        ids = db.scalars(expired).all()
+        if not ids:
+            return purged
+        db.execute(delete(models.UserSession).where(models.UserSession.id.in_(ids)))
+        db.commit()
+        purged += len(ids)
+        if len(ids) < batch_size:
+            return purged
+    return purged
+
+class SessionSweeper:
+    """Tarea de fondo que purga las sesiones vencidas cada `interval_seconds`.
+
+    Cada pasada borra a lo sumo `max_batches` lotes de `batch_size` filas en
+    un hilo del threadpool, así el event loop sigue atendiendo peticiones.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session],
+        interval_seconds: float = SWEEP_INTERVAL_SECONDS,
+        batch_size: int = PURGE_BATCH_SIZE,
+        max_batches: int = SWEEP_MAX_BATCHES,
+    ):
+        if batch_size < 1 or max_batches < 1:
+            raise ValueError("batch_size y max_batches deben ser al menos 1")
+        self.session_factory = session_factory
+        self.interval_seconds = interval_seconds
+        self.batch_size = batch_size
+        self.max_batches = max_batches
+        self._task: Optional[asyncio.Task] = None
+        self._lock = threading.Lock()
+        self._runs = 0
+        self._errors = 0
+        self._reclaimed = 0
+        self._run_seconds = 0.0
+        self._last_run_ms = 0.0
+        self._last_reclaimed = 0
+
+    def run_once(self) -> int:
+        """Ejecuta una pasada acotada y registra su duración."""
+        start = time.perf_counter()
+        db = self.session_factory()
+        try:
+            reclaimed = purge_expired_sessions(db, self.batch_size, max_batches=self.max_batches)
+        except Exception:
+            db.rollback()
+            with self._lock:
+                self._errors += 1
+            SWEEP_ERRORS.inc()
+            raise
+        finally:
+            db.close()
+        elapsed = time.perf_counter() - start
+        SWEEP_SECONDS.observe(elapsed)
+        SWEEP_RECLAIMED.inc(reclaimed)
+        with self._lock:
+            self._runs += 1
+            self._reclaimed += reclaimed
+            self._run_seconds += elapsed
+            self._last_run_ms = elapsed * 1000
+            self._last_reclaimed = reclaimed
+        return reclaimed
+
+    def stats(self) -> dict:
+        """Pasadas, filas recuperadas y tiempo de ejecución, para ajustar el intervalo."""
+        with self._lock:
+            return {
+                "interval_seconds": self.interval_seconds,
+                "batch_size": self.batch_size,
+                "max_batches": self.max_batches,
+                "runs": self._runs,
+                "errors": self._errors,
+                "reclaimed": self._reclaimed,
+                "run_seconds": round(self._run_seconds, 6),
+                "last_run_ms": round(self._last_run_ms, 3),
+                "last_reclaimed": self._last_reclaimed,
+            }
+
+    def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._loop())
+
+    async def stop(self) -> None:
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _loop(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval_seconds)
+            try:
+                await asyncio.to_thread(self.run_once)
+            except Exception:
+                # Ya quedó contado en errors; se reintenta en la próxima pasada
+                logger.exception("Falló la purga de sesiones vencidas")
@@ -0,0 +1,65 @@
+"""Single creates vs. create_many on PostgresUserRepositoryAdapter.
+
+Runs against DATABASE_URL, or a temporary SQLite file when it is not set.
+
+Usage:
+    PYTHONPATH=src python benchmarks/bulk_create_benchmark.py 5000
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from adapters.postgres.user_repository_adapter import PostgresUserRepositoryAdapter
+from domain.models.user import Base, User
+
+CHUNK_SIZE = 500
+
+
+def build_users(prefix: str, count: int):
+    return [
+        User(
+            username=f"{prefix}{i}",
+            email=f"{prefix}{i}@example.com",
+            password="password123",
+            dni=str(i),
+            fullName=f"User {i}",
+            phoneNumber="5551234",
+            status="POR_VERIFICAR",
+        )
+        for i in range(count)
+    ]
+
+
+def main(count: int) -> None:
+    url = os.getenv("DATABASE_URL")
+    if not url:
+        url = f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    repository = PostgresUserRepositoryAdapter(sessionmaker(bind=engine)())
+
+    start = time.perf_counter()
+    for user in build_users("single", count):
+        repository.create(user)
+    single = count / (time.perf_counter() - start)
+
+    start = time.perf_counter()
+    users = build_users("bulk", count)
+    # Mismos lotes que BulkCreateUsersUseCase
+    for i in range(0, count, CHUNK_SIZE):
+        repository.create_many(users[i : i + CHUNK_SIZE])
+    bulk = count / (time.perf_counter() - start)
+
+    print(f"single: {single:10.0f} users/s")
+    print(f"bulk:   {bulk:10.0f} users/s ({bulk / single:.1f}x)")
+    Base.metadata.drop_all(bind=engine)
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
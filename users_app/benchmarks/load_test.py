@@ -0,0 +1,306 @@
+"""Load test for the users service: throughput and latency per endpoint.
+
+Drives the service in-process over ASGI (--app, the default) or over HTTP
+(--url) with a fixed number of concurrent clients, and prints a JSON report
+with throughput and p50/p95/p99 latency per endpoint.
+
+The requests are either a weighted mix of create/auth/me/get/list/patch
+calls against a set of seed users (--mix), or replayed from a JSONL log
+(--replay) with one ``{"method", "path", "json"?, "headers"?, "name"?}``
+object per line; lines without method and path are skipped. The default
+mix leaves out get and list for the legacy app (app.main, or --url, since
+that is the deployed service), which does not serve them.
+
+The exit status is 1 when every request of an operation failed, e.g. a
+route the target does not have.
+
+Usage:
+    DATABASE_URL=sqlite:///./load.db PYTHONPATH=. \\
+        python benchmarks/load_test.py --requests 2000 --concurrency 20
+    PYTHONPATH=src python benchmarks/load_test.py \\
+        --app entrypoints.api.main:app --collection-path /users/
+    python benchmarks/load_test.py --url http://localhost:8000 --replay log.jsonl
+"""
+
+import argparse
+import asyncio
+import importlib
+import json
+import random
+import sys
+import time
+from collections import defaultdict
+from typing import Dict, Iterator, List, Optional
+
+import httpx
+
+# El servicio legacy (app/, el que se despliega) no tiene GET /users/{id} ni
+# el listado; la mezcla completa es para el de src/ (entrypoints.api.main)
+LEGACY_MIX = "create=1,auth=2,me=4,patch=1"
+FULL_MIX = "create=1,auth=2,me=4,get=2,list=1,patch=1"
+SEED_USERS = 20
+
+
+def parse_mix(mix: str) -> Dict[str, float]:
+    weights = {}
+    for item in mix.split(","):
+        name, _, weight = item.partition("=")
+        weights[name.strip()] = float(weight or 1)
+    unknown = set(weights) - set(MIX_REQUESTS)
+    if unknown:
+        raise SystemExit(f"Unknown mix entries: {', '.join(sorted(unknown))}")
+    return weights
+
+
+def user_payload(username: str) -> dict:
+    return {
+        "username": username,
+        "password": "password123",
+        "email": f"{username}@example.com",
+        "dni": "12345678",
+        "fullName": f"Load {username}",
+        "phoneNumber": "5551234",
+        "status": "POR_VERIFICAR",
+    }
+
+
+class Scenario:
+    """State shared by the mix requests: seed users and their tokens."""
+
+    def __init__(self, collection_path: str, run_id: str):
+        self.collection_path = collection_path
+        self.run_id = run_id
+        self.users: List[dict] = []
+        self.sequence = 0
+
+    def next_username(self) -> str:
+        self.sequence += 1
+        return f"load{self.run_id}u{self.sequence}"
+
+    async def seed(self, client: httpx.AsyncClient, count: int) -> None:
+        for _ in range(count):
+            payload = user_payload(self.next_username())
+            response = await client.post(self.collection_path, json=payload)
+            response.raise_for_status()
+            user_id = response.json()["id"]
+            response = await client.post(
+                "/users/auth",
+                json={"username": payload["username"], "password": "password123"},
+            )
+            response.raise_for_status()
+            self.users.append(
+                {"id": user_id, "payload": payload, "token": response.json()["token"]}
+            )
+
+
+def remember_token(user: dict):
+    """Keep the newest token: a new login may invalidate the previous one."""
+
+    def on_response(response: httpx.Response) -> None:
+        if response.status_code == 200:
+            user["token"] = response.json()["token"]
+
+    return on_response
+
+
+# Cada entrada arma (method, path, kwargs[, on_response]) a partir del escenario
+MIX_REQUESTS = {
+    "create": lambda s, u: (
+        "POST",
+        s.collection_path,
+        {"json": user_payload(s.next_username())},
+    ),
+    "auth": lambda s, u: (
+        "POST",
+        "/users/auth",
+        {"json": {"username": u["payload"]["username"], "password": "password123"}},
+        remember_token(u),
+    ),
+    "me": lambda s, u: (
+        "GET",
+        "/users/me",
+        {"headers": {"Authorization": f"Bearer {u['token']}"}},
+    ),
+    "get": lambda s, u: ("GET", f"/users/{u['id']}", {}),
+    "list": lambda s, u: ("GET", s.collection_path, {"params": {"limit": 50}}),
+    "patch": lambda s, u: (
+        "PATCH",
+        f"/users/{u['id']}",
+        {"json": {"fullName": f"Patched {random.random():.6f}"}},
+    ),
+}
+
+
+def mix_requests(scenario: Scenario, weights: Dict[str, float], count: int):
+    names, cum_weights = list(weights), []
+    total = 0.0
+    for name in names:
+        total += weights[name]
+        cum_weights.append(total)
+    for name in random.choices(names, cum_weights=cum_weights, k=count):
+        yield (name, *MIX_REQUESTS[name](scenario, random.choice(scenario.users)))
+
+
+def replay_requests(path: str, limit: Optional[int]) -> Iterator[tuple]:
+    skipped = 0
+    produced = 0
+    with open(path) as log:
+        for line in log:
+            if not line.strip():
+                continue
+            entry = json.loads(line)
+            if "method" not in entry or "path" not in entry:
+                skipped += 1
+                continue
+            kwargs = {k: entry[k] for k in ("json", "headers", "params") if k in entry}
+            method, path = entry["method"].upper(), entry["path"]
+            yield entry.get("name", f"{method} {path}"), method, path, kwargs
+            produced += 1
+            if limit and produced >= limit:
+                break
+    if skipped:
+        print(f"skipped {skipped} lines without method/path", file=sys.stderr)
+
+
+def percentile(sorted_values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_values:
+        return 0.0
+    rank = max(1, round(pct / 100 * len(sorted_values)))
+    return sorted_values[min(rank, len(sorted_values)) - 1]
+
+
+async def run(client: httpx.AsyncClient, requests, concurrency: int) -> dict:
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+    errors: Dict[str, int] = defaultdict(int)
+    requests = iter(requests)
+
+    async def worker():
+        for name, method, path, kwargs, *on_response in requests:
+            start = time.perf_counter()
+            try:
+                response = await client.request(method, path, **kwargs)
+            except httpx.HTTPError:
+                errors[name] += 1
+                continue
+            latencies[name].append((time.perf_counter() - start) * 1000)
+            statuses[name][response.status_code] += 1
+            for callback in on_response:
+                callback(response)
+            if response.status_code >= 400:
+                errors[name] += 1
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    duration = time.perf_counter() - start
+
+    endpoints = {}
+    for name in sorted(set(latencies) | set(errors)):
+        values = sorted(latencies[name])
+        endpoints[name] = {
+            "count": len(values),
+            "errors": errors[name],
+            "status": dict(statuses[name]),
+            "throughput_rps": round(len(values) / duration, 2),
+            "mean_ms": round(sum(values) / len(values), 3) if values else 0.0,
+            "p50_ms": round(percentile(values, 50), 3),
+            "p95_ms": round(percentile(values, 95), 3),
+            "p99_ms": round(percentile(values, 99), 3),
+        }
+    total = sum(e["count"] for e in endpoints.values())
+    return {
+        "requests": total,
+        "concurrency": concurrency,
+        "duration_s": round(duration, 3),
+        "throughput_rps": round(total / duration, 2),
+        "endpoints": endpoints,
+    }
+
+
+def load_app(target: str):
+    module_name, _, attr = target.partition(":")
+    return getattr(importlib.import_module(module_name), attr or "app")
+
+
+def build_client(args, app) -> httpx.AsyncClient:
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=args.timeout)
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest",
+        timeout=args.timeout,
+    )
+
+
+def default_mix(args) -> str:
+    return LEGACY_MIX if args.url or args.app.startswith("app.") else FULL_MIX
+
+
+def failed_operations(report: dict) -> List[str]:
+    """Operations whose requests all failed."""
+    return [
+        name
+        for name, endpoint in report["endpoints"].items()
+        if endpoint["errors"]
+        and not any(int(code) < 400 for code in endpoint["status"])
+    ]
+
+
+async def main(args) -> dict:
+    random.seed(args.seed)
+    if args.url:
+        return await drive(args, None)
+    app = load_app(args.app)
+    # ASGITransport no envía los eventos de lifespan: el arranque se hace aquí
+    async with app.router.lifespan_context(app):
+        return await drive(args, app)
+
+
+async def drive(args, app) -> dict:
+    async with build_client(args, app) as client:
+        if args.replay:
+            requests = replay_requests(args.replay, args.requests)
+        else:
+            scenario = Scenario(args.collection_path, f"{int(time.time())}")
+            await scenario.seed(client, args.seed_users)
+            mix = parse_mix(args.mix or default_mix(args))
+            requests = mix_requests(scenario, mix, args.requests)
+        report = await run(client, requests, args.concurrency)
+    report["target"] = args.url or args.app
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    target = parser.add_mutually_exclusive_group()
+    target.add_argument("--app", default="app.main:app", help="ASGI app module:attr")
+    target.add_argument("--url", help="Base URL of a running service")
+    parser.add_argument("--replay", help="JSONL request log to replay")
+    parser.add_argument(
+        "--mix",
+        help=f"name=weight,... (default {LEGACY_MIX} for app.main or --url, "
+        f"else {FULL_MIX})",
+    )
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--seed-users", type=int, default=SEED_USERS)
+    parser.add_argument("--collection-path", default="/users")
+    parser.add_argument("--timeout", type=float, default=30)
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = asyncio.run(main(args))
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text)
+    print(text)
+    failed = failed_operations(report)
+    if failed:
+        print(f"every request failed for: {', '.join(failed)}", file=sys.stderr)
+        sys.exit(1)
@@ -0,0 +1,46 @@
+"""Create latency of InMemoryUserRepositoryAdapter as the store grows.
+
+Usage:
+    PYTHONPATH=src python benchmarks/memory_create_benchmark.py 1000 100000 1000000
+"""
+
+import sys
+import time
+
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+
+SAMPLE = 1000
+
+
+def build_user(i: int) -> User:
+    return User(
+        username=f"user{i}",
+        email=f"user{i}@example.com",
+        password="password123",
+        dni=str(i),
+        fullName=f"User {i}",
+        phoneNumber="5551234",
+        status="POR_VERIFICAR",
+    )
+
+
+def measure(size: int) -> float:
+    """Fill the store up to `size` users and time SAMPLE more creates (µs/op)."""
+    repository = InMemoryUserRepositoryAdapter()
+    repository.clear_all()
+    for i in range(size):
+        repository.create(build_user(i))
+    users = [build_user(i) for i in range(size, size + SAMPLE)]
+    start = time.perf_counter()
+    for user in users:
+        repository.create(user)
+    elapsed = time.perf_counter() - start
+    repository.clear_all()
+    return elapsed / SAMPLE * 1_000_000
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    for size in sizes:
+        print(f"{size:>10} users: {measure(size):8.2f} us/create")
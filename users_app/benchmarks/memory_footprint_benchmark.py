@@ -0,0 +1,97 @@
+"""Bytes per user kept by the in-memory user store.
+
+Fills two stores with the same users and measures the memory they retain
+with tracemalloc:
+
+- objects: the previous layout, the ``User`` instances themselves in a
+  dict, plus the same secondary indexes.
+- records: InMemoryUserRepositoryAdapter, with ``UserRecord`` slots.
+
+Each status is built as a new string, as the API gets it from the request
+body, so interning in the records store is measured too.
+
+Usage:
+    PYTHONPATH=src python benchmarks/memory_footprint_benchmark.py 10000 100000
+"""
+
+import gc
+import json
+import sys
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+
+POD_LIMIT_BYTES = 256 * 1024 * 1024
+
+
+def build_user(i: int) -> User:
+    return User(
+        username=f"user{i}",
+        email=f"user{i}@example.com",
+        password="$2b$12$" + "x" * 53,
+        dni=str(10_000_000 + i),
+        fullName=f"User Number {i}",
+        phoneNumber=f"555{i:07d}",
+        # Un string nuevo por usuario, como los que llegan en el JSON
+        status="".join(["POR_", "VERIFICAR"]),
+    )
+
+
+class ObjectStore:
+    """The previous storage: mapped instances and their index keys."""
+
+    def __init__(self):
+        self.memory_store: Dict[int, User] = {}
+        self.username_index: Dict[str, int] = {}
+        self.email_index: Dict[str, int] = {}
+        self._indexed_keys: Dict[int, Tuple[str, str, str]] = {}
+        self.sorted_ids: List[int] = []
+
+    def create(self, user: User) -> User:
+        user.id = len(self.memory_store) + 1
+        self.memory_store[user.id] = user
+        self.username_index[user.username] = user.id
+        self.email_index[user.email] = user.id
+        self._indexed_keys[user.id] = (user.username, user.email, user.status)
+        self.sorted_ids.append(user.id)
+        return user
+
+
+def records_store():
+    repository = InMemoryUserRepositoryAdapter()
+    repository.clear_all()
+    return repository
+
+
+STORES: Dict[str, Callable] = {"objects": ObjectStore, "records": records_store}
+
+
+def footprint(store_factory: Callable, size: int) -> int:
+    """Bytes retained by a store holding `size` users."""
+    gc.collect()
+    tracemalloc.start()
+    store = store_factory()
+    for i in range(size):
+        store.create(build_user(i))
+    gc.collect()
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    if isinstance(store, InMemoryUserRepositoryAdapter):
+        store.clear_all()
+    return retained
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [10_000, 100_000]
+    results = {}
+    for size in sizes:
+        for name, factory in STORES.items():
+            per_user = footprint(factory, size) / size
+            results[f"{name}.{size}"] = {
+                "bytes_per_user": round(per_user),
+                "users_in_256Mi": int(POD_LIMIT_BYTES // per_user),
+            }
+            print(f"{name:>8} {size:>9}: {per_user:8.0f} bytes/user", file=sys.stderr)
+    print(json.dumps(results, indent=2))
@@ -0,0 +1,265 @@
+"""Per-operation cost of the user repositories as the store grows.
+
+Runs create, get_by_id, get_all, update, delete and count against
+InMemoryUserRepositoryAdapter and PostgresUserRepositoryAdapter (on
+DATABASE_URL, or a temporary SQLite file when it is not set) and writes the
+latency of each operation as JSON. The compare mode fails when an operation
+got slower than the allowed percentage; it also reads the results of
+pets_app/benchmarks/repository_benchmark.py, which use the same format.
+
+Usage:
+    PYTHONPATH=src python benchmarks/repository_benchmark.py run \\
+        --sizes 1000 100000 1000000 --output current.json
+    PYTHONPATH=src python benchmarks/repository_benchmark.py compare baseline.json current.json \\
+        --threshold 10 --op-threshold get_all=25
+"""
+
+import argparse
+import gc
+import json
+import os
+import platform
+import random
+import sys
+import tempfile
+import time
+from typing import Callable, Dict, List
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from adapters.postgres.user_repository_adapter import PostgresUserRepositoryAdapter
+from domain.models.user import Base, User
+
+OPERATIONS = ("create", "get_by_id", "get_all", "update", "delete", "count")
+FILL_BATCH = 5000
+# get_all recorre todo el store: se mide menos veces
+GET_ALL_RUNS = 3
+
+
+def build_user(i: int) -> User:
+    return User(
+        username=f"user{i}",
+        email=f"user{i}@example.com",
+        password="password123",
+        dni=str(i),
+        fullName=f"User {i}",
+        phoneNumber="5551234",
+        status="POR_VERIFICAR",
+    )
+
+
+def summarize(samples_ns: List[int]) -> dict:
+    samples = sorted(samples_ns)
+    return {
+        "ops": len(samples),
+        "mean_us": round(sum(samples) / len(samples) / 1000, 3),
+        "p50_us": round(samples[len(samples) // 2] / 1000, 3),
+        "p95_us": round(
+            samples[min(len(samples) - 1, len(samples) * 95 // 100)] / 1000, 3
+        ),
+    }
+
+
+def timed(call: Callable, args_list) -> List[int]:
+    samples = []
+    # Como timeit: sin pausas del recolector dentro de la medición
+    gc.disable()
+    try:
+        for args in args_list:
+            start = time.perf_counter_ns()
+            call(*args)
+            samples.append(time.perf_counter_ns() - start)
+    finally:
+        gc.enable()
+    return samples
+
+
+def measure(repository, size: int, sample: int, operations) -> Dict[str, dict]:
+    """Fill the repository up to `size` users and time `sample` calls per operation."""
+    for start in range(0, size, FILL_BATCH):
+        repository.create_many(
+            [build_user(i) for i in range(start, min(size, start + FILL_BATCH))]
+        )
+    ids = [user.id for user in repository.get_page(sample)]
+    rng = random.Random(size)
+    results = {}
+
+    # create y delete usan los mismos usuarios nuevos, así el tamaño no cambia
+    new_users = [build_user(i) for i in range(size, size + sample)]
+    created = []
+    samples = timed(
+        lambda u: created.append(repository.create(u)), [(u,) for u in new_users]
+    )
+    if "create" in operations:
+        results["create"] = summarize(samples)
+    if "get_by_id" in operations:
+        lookups = [(rng.choice(ids),) for _ in range(sample)]
+        results["get_by_id"] = summarize(timed(repository.get_by_id, lookups))
+    if "update" in operations:
+        users = [repository.get_by_id(rng.choice(ids)) for _ in range(sample)]
+        results["update"] = summarize(timed(repository.update, [(u,) for u in users]))
+    if "count" in operations:
+        results["count"] = summarize(timed(repository.count, [()] * sample))
+    if "get_all" in operations:
+        results["get_all"] = summarize(timed(repository.get_all, [()] * GET_ALL_RUNS))
+    samples = timed(repository.delete, [(u.id,) for u in created])
+    if "delete" in operations:
+        results["delete"] = summarize(samples)
+    return results
+
+
+def memory_repository():
+    repository = InMemoryUserRepositoryAdapter()
+    repository.clear_all()
+    return repository, repository.clear_all
+
+
+def postgres_repository():
+    url = os.getenv("DATABASE_URL") or f"sqlite:///{tempfile.mkdtemp()}/bench.db"
+    engine = create_engine(url)
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(bind=engine)()
+
+    def teardown():
+        session.close()
+        Base.metadata.drop_all(bind=engine)
+        engine.dispose()
+
+    return PostgresUserRepositoryAdapter(session), teardown
+
+
+ADAPTERS = {"memory": memory_repository, "postgres": postgres_repository}
+
+
+def run(args) -> dict:
+    results = {}
+    for adapter in args.adapters:
+        for size in args.sizes:
+            repository, teardown = ADAPTERS[adapter]()
+            try:
+                measured = measure(repository, size, args.sample, args.operations)
+            finally:
+                teardown()
+            for operation, stats in measured.items():
+                results[f"users.{adapter}.{size}.{operation}"] = stats
+                print(
+                    f"{adapter:>8} {size:>9} {operation:>10}: "
+                    f"{stats['p50_us']:10.2f} us p50",
+                    file=sys.stderr,
+                )
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "sample": args.sample,
+        },
+        "results": results,
+    }
+
+
+def compare(
+    baseline: dict,
+    current: dict,
+    threshold: float,
+    op_thresholds: Dict[str, float],
+    metric: str,
+    min_delta_us: float = 0.0,
+):
+    """List the operations slower than allowed; the result is empty when all pass.
+
+    Slowdowns below `min_delta_us` are ignored: for sub-microsecond operations
+    a few percent is timer noise.
+    """
+    regressions = []
+    for key, stats in sorted(current["results"].items()):
+        base = baseline["results"].get(key)
+        if not base or not base[metric]:
+            continue
+        change = (stats[metric] - base[metric]) / base[metric] * 100
+        allowed = op_thresholds.get(key.rsplit(".", 1)[-1], threshold)
+        regressed = change > allowed and stats[metric] - base[metric] >= min_delta_us
+        status = "REGRESSION" if regressed else "ok"
+        print(
+            f"{key:<40} {base[metric]:>10.2f} -> {stats[metric]:>10.2f} us "
+            f"{change:+7.1f}% (max {allowed:+.0f}%) {status}"
+        )
+        if regressed:
+            regressions.append(key)
+    return regressions
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+    run_parser = commands.add_parser("run", help="Run the benchmarks")
+    run_parser.add_argument(
+        "--sizes", type=int, nargs="+", default=[1_000, 100_000, 1_000_000]
+    )
+    run_parser.add_argument(
+        "--adapters", nargs="+", choices=ADAPTERS, default=list(ADAPTERS)
+    )
+    run_parser.add_argument(
+        "--operations", nargs="+", choices=OPERATIONS, default=list(OPERATIONS)
+    )
+    run_parser.add_argument(
+        "--sample", type=int, default=1000, help="Calls per operation"
+    )
+    run_parser.add_argument(
+        "--output", help="JSON file for the results (default stdout)"
+    )
+    compare_parser = commands.add_parser("compare", help="Compare two result files")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument(
+        "--threshold", type=float, default=10, help="Max slowdown in %%"
+    )
+    compare_parser.add_argument(
+        "--op-threshold", action="append", default=[], metavar="OP=PCT"
+    )
+    compare_parser.add_argument(
+        "--min-delta-us",
+        type=float,
+        default=1.0,
+        help="Ignore slowdowns smaller than this many microseconds",
+    )
+    compare_parser.add_argument(
+        "--metric", default="p50_us", choices=("mean_us", "p50_us", "p95_us")
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None) -> int:
+    args = parse_args(argv)
+    if args.command == "run":
+        text = json.dumps(run(args), indent=2)
+        if args.output:
+            with open(args.output, "w") as output:
+                output.write(text)
+        else:
+            print(text)
+        return 0
+    with open(args.baseline) as baseline, open(args.current) as current:
+        op_thresholds = {
+            op: float(pct)
+            for op, _, pct in (o.partition("=") for o in args.op_threshold)
+        }
+        regressions = compare(
+            json.load(baseline),
+            json.load(current),
+            args.threshold,
+            op_thresholds,
+            args.metric,
+            args.min_delta_us,
+        )
+    if regressions:
+        print(f"{len(regressions)} operation(s) regressed", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
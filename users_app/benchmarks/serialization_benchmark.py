@@ -0,0 +1,86 @@
+"""Serialization time of a user list: default route vs. the fast path.
+
+Both paths are FastAPI routes that return the same list, called through a
+TestClient, like GET /users/ does with FAST_JSON_RESPONSES off and on:
+
+- default: the users are returned as is and FastAPI validates them with
+  ``response_model=List[UserResponse]``, then renders a JSONResponse.
+- fast: the route returns the bytes of the precompiled
+  UserListSerializer (orjson when installed).
+
+Both bodies are checked to be equal before timing.
+
+Usage:
+    PYTHONPATH=src python benchmarks/serialization_benchmark.py 10000
+"""
+
+import json
+import sys
+import time
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from domain.models.user import User
+from domain.models.user_response import UserResponse
+from entrypoints.api.responses import user_list_serializer
+
+ROUNDS = 20
+
+
+def build_users(count: int):
+    return [
+        User(
+            id=i,
+            username=f"user{i}",
+            email=f"user{i}@example.com",
+            password="password123",
+            dni=str(i),
+            fullName=f"User {i}",
+            phoneNumber="5551234",
+            status="POR_VERIFICAR",
+        )
+        for i in range(count)
+    ]
+
+
+def build_client(users) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[UserResponse])
+    async def default_route():
+        return users
+
+    @app.get("/fast")
+    async def fast_route():
+        return Response(
+            user_list_serializer.dumps(users), media_type="application/json"
+        )
+
+    return TestClient(app)
+
+
+def measure(client: TestClient, path: str) -> float:
+    """Best of ROUNDS, in milliseconds."""
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        client.get(path).raise_for_status()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main(count: int) -> None:
+    client = build_client(build_users(count))
+    default_body = client.get("/default").json()
+    if default_body != json.loads(client.get("/fast").content):
+        raise SystemExit("The default and fast bodies differ")
+    default = measure(client, "/default")
+    fast = measure(client, "/fast")
+    print(f"default: {default:8.2f} ms for {count} users")
+    print(f"fast:    {fast:8.2f} ms ({default / fast:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 10000)
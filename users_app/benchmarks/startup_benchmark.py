@@ -0,0 +1,119 @@
+"""Cold-start cost of the users service: imports and lifespan startup.
+
+Imports the app in a fresh interpreter under ``python -X importtime`` and
+reports the total import time, the slowest modules (self and cumulative
+time) and how long the lifespan startup and shutdown take. Each run is a
+new process, so nothing is cached between runs.
+
+Usage:
+    DATABASE_URL=sqlite:///./startup.db PYTHONPATH=. \\
+        python benchmarks/startup_benchmark.py --runs 5
+    PYTHONPATH=src python benchmarks/startup_benchmark.py \\
+        --app entrypoints.api.main:app --top 15
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+from typing import Dict, List
+
+# Línea de -X importtime: "import time: self [us] | cumulative | imported package"
+IMPORTTIME_LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+# Se ejecuta en el proceso hijo; imprime una línea JSON al final
+CHILD = """
+import asyncio, importlib, json, time
+start = time.perf_counter()
+module_name, _, attr = {target!r}.partition(":")
+app = getattr(importlib.import_module(module_name), attr or "app")
+imported = time.perf_counter()
+
+async def lifespan():
+    context = app.router.lifespan_context(app)
+    began = time.perf_counter()
+    await context.__aenter__()
+    started = time.perf_counter()
+    await context.__aexit__(None, None, None)
+    return started - began, time.perf_counter() - started
+
+startup, shutdown = asyncio.run(lifespan())
+print(json.dumps({{
+    "import_ms": (imported - start) * 1000,
+    "startup_ms": startup * 1000,
+    "shutdown_ms": shutdown * 1000,
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> List[dict]:
+    modules = []
+    for line in stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if match:
+            own, cumulative, indent, name = match.groups()
+            modules.append(
+                {
+                    "module": name,
+                    "self_ms": int(own) / 1000,
+                    "cumulative_ms": int(cumulative) / 1000,
+                    "depth": len(indent) // 2,
+                }
+            )
+    return modules
+
+
+def run_once(target: str) -> dict:
+    completed = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD.format(target=target)],
+        capture_output=True,
+        text=True,
+        env=os.environ.copy(),
+    )
+    if completed.returncode != 0:
+        raise SystemExit(completed.stderr)
+    result = json.loads(completed.stdout.strip().splitlines()[-1])
+    result["modules"] = parse_importtime(completed.stderr)
+    return result
+
+
+def summarize(runs: List[dict], top: int) -> dict:
+    report: Dict[str, object] = {"runs": len(runs)}
+    for key in ("import_ms", "startup_ms", "shutdown_ms"):
+        values = [run[key] for run in runs]
+        report[key] = {
+            "median": round(statistics.median(values), 3),
+            "min": round(min(values), 3),
+            "max": round(max(values), 3),
+        }
+    # Los módulos de la última ejecución; las anteriores sólo dan los totales
+    modules = runs[-1]["modules"]
+    for key in ("self_ms", "cumulative_ms"):
+        slowest = sorted(modules, key=lambda m: -m[key])[:top]
+        report[f"slowest_{key[:-3]}"] = [
+            {"module": m["module"], key: round(m[key], 3)} for m in slowest
+        ]
+    return report
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--app", default="app.main:app", help="ASGI app module:attr")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10, help="Slowest modules listed")
+    parser.add_argument("--output", help="Also write the JSON report here")
+    return parser.parse_args(argv)
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    report = summarize([run_once(args.app) for _ in range(args.runs)], args.top)
+    report["target"] = args.app
+    text = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, "w") as output:
+            output.write(text)
+    print(text)
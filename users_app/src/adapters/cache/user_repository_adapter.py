@@ -0,0 +1,196 @@
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, AsyncIterator, Hashable, List, Optional, Tuple
+
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+
+MISSING = object()
+
+
+class LruTtlCache:
+    """Bounded LRU cache whose entries expire after a TTL.
+
+    Entries are ``key -> (value, expires_at)`` with ``expires_at`` a
+    ``time.monotonic()`` value. ``generation`` changes on every invalidation,
+    so a value loaded before a write can be discarded instead of cached.
+    """
+
+    def __init__(self, max_size: int = 1024, ttl_seconds: float = 60):
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[Hashable, Tuple[Any, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, key: Hashable) -> Any:
+        """Get a cached value, MISSING if absent or expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] <= time.monotonic():
+                del self._entries[key]
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return MISSING
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return entry[0]
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        ttl_seconds: Optional[float] = None,
+        generation: Optional[int] = None,
+    ) -> None:
+        """Cache a value, unless the cache was invalidated since `generation`."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+            self._entries[key] = (value, time.monotonic() + ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self, *keys: Hashable) -> None:
+        """Drop the given keys."""
+        with self._lock:
+            self.generation += 1
+            for key in keys:
+                self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        with self._lock:
+            self.generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Get size, hit, miss and eviction counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+            }
+
+
+class CachedUserRepository(AsyncUserRepositoryPort):
+    """Read-through cache in front of another user repository.
+
+    ``get_by_id`` and ``get_by_username`` are served from a shared
+    LruTtlCache (usernames map to ids); missing users are cached too, for
+    ``negative_ttl_seconds``. Writes go to the wrapped repository and
+    invalidate the affected keys. The cache outlives the wrapped repository,
+    which may be built per request.
+    """
+
+    def __init__(
+        self,
+        repository: AsyncUserRepositoryPort,
+        cache: LruTtlCache,
+        negative_ttl_seconds: float = 5,
+    ):
+        self.repository = repository
+        self.cache = cache
+        self.negative_ttl_seconds = negative_ttl_seconds
+
+    def _store(self, key, value, generation: int) -> None:
+        ttl = None if value is not None else self.negative_ttl_seconds
+        self.cache.set(key, value, ttl, generation)
+
+    async def create(self, user: User) -> User:
+        created = await self.repository.create(user)
+        # Puede haber un resultado negativo cacheado para el id o el username
+        self.cache.invalidate(("id", created.id), ("username", created.username))
+        return created
+
+    async def create_many(self, users: List[User]) -> List[Optional[User]]:
+        created = await self.repository.create_many(users)
+        keys = []
+        for user in created:
+            if user is not None:
+                keys += [("id", user.id), ("username", user.username)]
+        if keys:
+            self.cache.invalidate(*keys)
+        return created
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        user = self.cache.get(("id", user_id))
+        if user is MISSING:
+            generation = self.cache.generation
+            user = await self.repository.get_by_id(user_id)
+            self._store(("id", user_id), user, generation)
+        return user
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        # Se cachea username -> id; el usuario sale del cache por id, así un
+        # cambio de username no deja una entrada obsoleta
+        user_id = self.cache.get(("username", username))
+        if user_id is None:
+            return None
+        if user_id is not MISSING:
+            user = await self.get_by_id(user_id)
+            if user is not None and user.username == username:
+                return user
+        generation = self.cache.generation
+        user = await self.repository.get_by_username(username)
+        self._store(
+            ("username", username), None if user is None else user.id, generation
+        )
+        if user is not None:
+            self._store(("id", user.id), user, generation)
+        return user
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self.repository.get_by_email(email)
+
+    async def get_all(self) -> List[User]:
+        return await self.repository.get_all()
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        return await self.repository.get_page(limit, cursor, status, username_prefix)
+
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[User]:
+        return self.repository.iter_all(chunk_size)
+
+    async def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        return await self.repository.count(status, exact)
+
+    async def update(self, user: User) -> User:
+        try:
+            return await self.repository.update(user)
+        finally:
+            self.cache.invalidate(("id", user.id), ("username", user.username))
+
+    async def patch(self, user_id: int, fields: dict) -> User:
+        try:
+            return await self.repository.patch(user_id, fields)
+        finally:
+            self.cache.invalidate(("id", user_id), ("username", fields.get("username")))
+
+    async def delete(self, user_id: int) -> User:
+        try:
+            return await self.repository.delete(user_id)
+        finally:
+            self.cache.invalidate(("id", user_id))
+
+    async def clear_all(self) -> None:
+        try:
+            await self.repository.clear_all()
+        finally:
+            self.cache.clear()
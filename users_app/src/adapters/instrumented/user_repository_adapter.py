@@ -0,0 +1,99 @@
+import time
+from typing import AsyncIterator, List, Optional
+
+from prometheus_client import Histogram
+
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+
+REPOSITORY_LATENCY = Histogram(
+    "users_repository_operation_seconds",
+    "Latency of user repository operations.",
+    ["backend", "operation"],
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+
+
+class InstrumentedUserRepository(AsyncUserRepositoryPort):
+    """Records the latency of every operation of another user repository."""
+
+    def __init__(self, repository: AsyncUserRepositoryPort, backend: str):
+        self.repository = repository
+        self.backend = backend
+
+    def _timer(self, operation: str):
+        return REPOSITORY_LATENCY.labels(self.backend, operation).time()
+
+    async def create(self, user: User) -> User:
+        with self._timer("create"):
+            return await self.repository.create(user)
+
+    async def create_many(self, users: List[User]) -> List[Optional[User]]:
+        with self._timer("create_many"):
+            return await self.repository.create_many(users)
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        with self._timer("get_by_id"):
+            return await self.repository.get_by_id(user_id)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        with self._timer("get_by_username"):
+            return await self.repository.get_by_username(username)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        with self._timer("get_by_email"):
+            return await self.repository.get_by_email(email)
+
+    async def get_all(self) -> List[User]:
+        with self._timer("get_all"):
+            return await self.repository.get_all()
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        with self._timer("get_page"):
+            return await self.repository.get_page(
+                limit, cursor, status, username_prefix
+            )
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[User]:
+        # Se mide el recorrido completo, sin el tiempo que el consumidor tarda
+        # en procesar cada usuario
+        elapsed = 0.0
+        iterator = self.repository.iter_all(chunk_size).__aiter__()
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    user = await iterator.__anext__()
+                except StopAsyncIteration:
+                    return
+                finally:
+                    elapsed += time.perf_counter() - start
+                yield user
+        finally:
+            REPOSITORY_LATENCY.labels(self.backend, "iter_all").observe(elapsed)
+
+    async def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        with self._timer("count"):
+            return await self.repository.count(status, exact)
+
+    async def update(self, user: User) -> User:
+        with self._timer("update"):
+            return await self.repository.update(user)
+
+    async def patch(self, user_id: int, fields: dict) -> User:
+        with self._timer("patch"):
+            return await self.repository.patch(user_id, fields)
+
+    async def delete(self, user_id: int) -> User:
+        with self._timer("delete"):
+            return await self.repository.delete(user_id)
+
+    async def clear_all(self) -> None:
+        with self._timer("clear_all"):
+            await self.repository.clear_all()
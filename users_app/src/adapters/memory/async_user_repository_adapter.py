@@ -0,0 +1,62 @@
+from typing import AsyncIterator, List, Optional
+
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+
+
+class AsyncInMemoryUserRepositoryAdapter(AsyncUserRepositoryPort):
+    """Async facade over InMemoryUserRepositoryAdapter.
+
+    Every in-memory operation is CPU-only and short, so it runs inline on the
+    event loop instead of being sent to a thread.
+    """
+
+    def __init__(self, repository: InMemoryUserRepositoryAdapter):
+        self.repository = repository
+
+    async def create(self, user: User) -> User:
+        return self.repository.create(user)
+
+    async def create_many(self, users: List[User]) -> List[Optional[User]]:
+        return self.repository.create_many(users)
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return self.repository.get_by_id(user_id)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        return self.repository.get_by_username(username)
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return self.repository.get_by_email(email)
+
+    async def get_all(self) -> List[User]:
+        return self.repository.get_all()
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        return self.repository.get_page(limit, cursor, status, username_prefix)
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[User]:
+        for user in self.repository.iter_all(chunk_size):
+            yield user
+
+    async def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        return self.repository.count(status, exact)
+
+    async def update(self, user: User) -> User:
+        return self.repository.update(user)
+
+    async def patch(self, user_id: int, fields: dict) -> User:
+        return self.repository.patch(user_id, fields)
+
+    async def delete(self, user_id: int) -> User:
+        return self.repository.delete(user_id)
+
+    async def clear_all(self) -> None:
+        self.repository.clear_all()
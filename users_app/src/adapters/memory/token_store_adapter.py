@@ -0,0 +1,156 @@
+import heapq
+import threading
+import time
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from domain.ports.token_store_port import TokenStorePort
+
+
+class InMemoryTokenStoreAdapter(TokenStorePort):
+    """In memory implementation of TokenStore with expiry-ordered eviction.
+
+    Tokens map to ``(user_id, expires_at)`` where ``expires_at`` is a
+    ``time.monotonic()`` value. A min-heap ordered by expiry lets expired
+    tokens, or the soonest to expire when the store is full, be evicted
+    without scanning every entry.
+    """
+
+    def __init__(self, max_size: int = 0):
+        self.max_size = max_size
+        self._tokens: Dict[str, Tuple[int, float]] = {}
+        self._expiries: List[Tuple[float, str]] = []
+        self._lock = threading.Lock()
+        self._evictions = 0
+        self._lookups = 0
+        self._lookup_ns = 0
+        self._sweeper: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+        self._sweeps = 0
+        self._swept = 0
+        self._sweep_ns = 0
+        self._last_sweep_ns = 0
+        self._last_swept = 0
+
+    def issue(self, user_id: int, ttl_seconds: float) -> str:
+        """Issue a new token for the user."""
+        token = str(uuid4())
+        expires_at = time.monotonic() + ttl_seconds
+        with self._lock:
+            if self.max_size and len(self._tokens) >= self.max_size:
+                self._purge(time.monotonic())
+                while len(self._tokens) >= self.max_size:
+                    self._pop_soonest()
+            self._tokens[token] = (user_id, expires_at)
+            heapq.heappush(self._expiries, (expires_at, token))
+        return token
+
+    def resolve(self, token: str) -> Optional[int]:
+        """Get the user ID of a valid token, None if unknown or expired."""
+        start = time.perf_counter_ns()
+        with self._lock:
+            entry = self._tokens.get(token)
+            if entry is not None and entry[1] <= time.monotonic():
+                # Expulsión perezosa; la entrada del heap se descarta al salir
+                del self._tokens[token]
+                self._evictions += 1
+                entry = None
+            self._lookups += 1
+            self._lookup_ns += time.perf_counter_ns() - start
+        return None if entry is None else entry[0]
+
+    def purge_expired(self, limit: Optional[int] = None) -> int:
+        """Remove expired tokens and return how many were removed."""
+        with self._lock:
+            return self._purge(time.monotonic(), limit)
+
+    def sweep(self, batch_size: int) -> int:
+        """Purge every expired token, `batch_size` at a time.
+
+        The lock is released between batches, so a lookup waits for one
+        batch at most, never for the whole sweep.
+        """
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        start = time.perf_counter_ns()
+        swept = 0
+        while True:
+            removed = self.purge_expired(batch_size)
+            swept += removed
+            if removed < batch_size:
+                break
+            # Cede el GIL a los hilos que esperan el lock
+            time.sleep(0)
+        elapsed = time.perf_counter_ns() - start
+        with self._lock:
+            self._sweeps += 1
+            self._swept += swept
+            self._sweep_ns += elapsed
+            self._last_sweep_ns = elapsed
+            self._last_swept = swept
+        return swept
+
+    def stats(self) -> dict:
+        """Get size, eviction, lookup latency and sweeper counters."""
+        with self._lock:
+            lookups = self._lookups
+            return {
+                "size": len(self._tokens),
+                "evictions": self._evictions,
+                "lookups": lookups,
+                "avg_lookup_us": self._lookup_ns / lookups / 1000 if lookups else 0.0,
+                "sweeps": self._sweeps,
+                "swept": self._swept,
+                "sweep_seconds": self._sweep_ns / 1e9,
+                "last_sweep_ms": self._last_sweep_ns / 1e6,
+                "last_swept": self._last_swept,
+            }
+
+    def start_sweeper(self, interval_seconds: float, batch_size: int = 1000) -> None:
+        """Start a daemon thread that sweeps expired tokens periodically."""
+        if batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self._sweeper is not None:
+            return
+        self._stop.clear()
+        self._sweeper = threading.Thread(
+            target=self._sweep, args=(interval_seconds, batch_size), daemon=True
+        )
+        self._sweeper.start()
+
+    def stop_sweeper(self) -> None:
+        """Stop the sweeper thread."""
+        if self._sweeper is None:
+            return
+        self._stop.set()
+        self._sweeper.join()
+        self._sweeper = None
+
+    def clear(self) -> None:
+        """Remove every token."""
+        with self._lock:
+            self._tokens.clear()
+            self._expiries.clear()
+
+    def _sweep(self, interval_seconds: float, batch_size: int) -> None:
+        while not self._stop.wait(interval_seconds):
+            self.sweep(batch_size)
+
+    def _purge(self, now: float, limit: Optional[int] = None) -> int:
+        removed = 0
+        while self._expiries and self._expiries[0][0] <= now:
+            if limit is not None and removed >= limit:
+                break
+            if self._pop_soonest():
+                removed += 1
+        return removed
+
+    def _pop_soonest(self) -> bool:
+        """Pop the heap head, deleting its token unless the entry is stale."""
+        expires_at, token = heapq.heappop(self._expiries)
+        entry = self._tokens.get(token)
+        if entry is None or entry[1] != expires_at:
+            return False
+        del self._tokens[token]
+        self._evictions += 1
+        return True
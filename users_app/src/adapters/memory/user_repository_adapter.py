@@ -1,14 +1,82 @@
-from typing import Dict, List, Optional
+import sys
+from bisect import bisect_right
+from operator import attrgetter
+from typing import Dict, Iterator, List, Optional
+
+from sqlalchemy.orm.attributes import set_committed_value
 
 from domain.models.user import User
 from domain.ports.user_repository_port import UserRepositoryPort
 from errors import UserAlreadyExistsError, UserNotFoundError
 
+USER_FIELDS = (
+    "id",
+    "username",
+    "password",
+    "email",
+    "dni",
+    "fullName",
+    "phoneNumber",
+    "status",
+)
+_record_values = attrgetter(*USER_FIELDS)
+
+
+class UserRecord:
+    """Stored copy of a user with fixed slots.
+
+    A mapped ``User`` carries a ``__dict__`` and its SQLAlchemy instance
+    state; a record only keeps the column values. ``status`` is interned,
+    so every user with the same status shares one string.
+    """
+
+    __slots__ = USER_FIELDS
+
+    def __init__(self, **values):
+        for field in USER_FIELDS:
+            setattr(self, field, values.get(field))
+        if isinstance(self.status, str):
+            self.status = sys.intern(self.status)
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserRecord":
+        return cls(**{field: getattr(user, field) for field in USER_FIELDS})
+
+    def replace(self, fields: dict) -> "UserRecord":
+        """Get a copy with the given fields changed."""
+        values = {field: getattr(self, field) for field in USER_FIELDS}
+        values.update(fields)
+        return UserRecord(**values)
+
+    def to_user(self) -> User:
+        """Materialize a detached ``User`` with the stored values."""
+        # Los valores quedan como ya cargados, sin historial de cambios: un
+        # User(**values) los marcaría como pendientes y es algo más lento
+        user = User()
+        for field, value in zip(USER_FIELDS, _record_values(self)):
+            set_committed_value(user, field, value)
+        return user
+
 
 class InMemoryUserRepositoryAdapter(UserRepositoryPort):
-    """In memory implementation of UserRepository."""
+    """In memory implementation of UserRepository.
+
+    Users are stored as ``UserRecord`` and returned as new ``User``
+    objects: changing a returned user does not change the store until it
+    is passed to ``update``.
+    """
 
-    memory_store: Dict[int, User] = {}
+    memory_store: Dict[int, UserRecord] = {}
+    # Índices secundarios: username/email -> id
+    username_index: Dict[str, int] = {}
+    email_index: Dict[str, int] = {}
+    # Contador de usuarios por status, para contar en O(1)
+    status_counts: Dict[str, int] = {}
+    # IDs ordenados para paginar por cursor sin recorrer todo el store. Un
+    # delete deja su ID (tombstone) y la lista se compacta cuando los
+    # tombstones superan a los vivos: borrar del medio de la lista es O(n)
+    sorted_ids: List[int] = []
+    _tombstones: int = 0
     _id_counter: int = 1  # <-- contador incremental
 
     def sequence(self) -> int:
@@ -17,42 +85,163 @@ class InMemoryUserRepositoryAdapter(UserRepositoryPort):
         self._id_counter += 1
         return current_id
 
+    def _check_unique(
+        self, username: str, email: str, user_id: Optional[int] = None
+    ) -> None:
+        """Raise if the username or email belongs to another user."""
+        for owner_id in (
+            self.username_index.get(username),
+            self.email_index.get(email),
+        ):
+            if owner_id is not None and owner_id != user_id:
+                raise UserAlreadyExistsError("Username or email already exists")
+
+    def _index(self, record: UserRecord) -> None:
+        """Add the record keys to the secondary indexes."""
+        self.username_index[record.username] = record.id
+        self.email_index[record.email] = record.id
+        self.status_counts[record.status] = self.status_counts.get(record.status, 0) + 1
+
+    def _unindex(self, record: UserRecord) -> None:
+        """Remove the record keys from the secondary indexes."""
+        # Los records no salen del store, así que sus claves son las indexadas
+        del self.username_index[record.username]
+        del self.email_index[record.email]
+        self.status_counts[record.status] -= 1
+        if not self.status_counts[record.status]:
+            del self.status_counts[record.status]
+
     def create(self, user: User) -> User:
         """Create a new user."""
         # Validación de username y email únicos
-        for existing_user in self.memory_store.values():
-            if (
-                existing_user.username == user.username
-                or existing_user.email == user.email
-            ):
-                raise UserAlreadyExistsError("Username or email already exists")
+        self._check_unique(user.username, user.email)
         user.id = self.sequence()
-        self.memory_store[user.id] = user
+        record = UserRecord.from_user(user)
+        self.memory_store[user.id] = record
+        self._index(record)
+        # La secuencia es creciente, así que agregar al final mantiene el orden
+        self.sorted_ids.append(user.id)
         return user
 
+    def create_many(self, users: List[User]) -> List[Optional[User]]:
+        """Create a batch of users, None for the duplicated ones."""
+        created = []
+        for user in users:
+            try:
+                created.append(self.create(user))
+            except UserAlreadyExistsError:
+                created.append(None)
+        return created
+
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
-        return self.memory_store.get(user_id)
+        record = self.memory_store.get(user_id)
+        return None if record is None else record.to_user()
+
+    def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username."""
+        user_id = self.username_index.get(username)
+        return None if user_id is None else self.get_by_id(user_id)
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        user_id = self.email_index.get(email)
+        return None if user_id is None else self.get_by_id(user_id)
 
     def get_all(self) -> List[User]:
         """Get all users."""
-        return list(self.memory_store.values())
+        return [record.to_user() for record in self.memory_store.values()]
+
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        """Get up to `limit` users with ID greater than `cursor`, ordered by ID."""
+        start = 0 if cursor is None else bisect_right(self.sorted_ids, cursor)
+        page = []
+        # Se filtra sobre los records; sólo la página se materializa
+        for i in range(start, len(self.sorted_ids)):
+            record = self.memory_store.get(self.sorted_ids[i])
+            if record is None:
+                continue
+            if status is not None and record.status != status:
+                continue
+            if username_prefix and not record.username.startswith(username_prefix):
+                continue
+            page.append(record)
+            if len(page) == limit:
+                break
+        return [record.to_user() for record in page]
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[User]:
+        """Iterate over all users ordered by ID, one page at a time."""
+        cursor = None
+        while True:
+            page = self.get_page(chunk_size, cursor)
+            yield from page
+            if len(page) < chunk_size:
+                return
+            cursor = page[-1].id
+
+    def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        """Count users, optionally only those with the given status."""
+        if status is None:
+            return len(self.memory_store)
+        return self.status_counts.get(status, 0)
 
     def update(self, user: User) -> User:
         """Update an existing user."""
         if user.id not in self.memory_store:
             raise UserNotFoundError(f"User with id {user.id} not found")
-        self.memory_store[user.id] = user
+        self._check_unique(user.username, user.email, user.id)
+        self._unindex(self.memory_store[user.id])
+        record = UserRecord.from_user(user)
+        self.memory_store[user.id] = record
+        self._index(record)
         return user
 
+    def patch(self, user_id: int, fields: dict) -> User:
+        """Set the given fields of an existing user."""
+        record = self.memory_store.get(user_id)
+        if record is None:
+            raise UserNotFoundError(f"User with id {user_id} not found")
+        if "username" in fields or "email" in fields:
+            self._check_unique(
+                fields.get("username", record.username),
+                fields.get("email", record.email),
+                user_id,
+            )
+        self._unindex(record)
+        record = record.replace(fields)
+        self.memory_store[user_id] = record
+        self._index(record)
+        return record.to_user()
+
     def delete(self, user_id: int) -> User:
         """Delete a user."""
         if user_id not in self.memory_store:
             raise UserNotFoundError(f"User with id {user_id} not found")
-        user = self.memory_store[user_id]
-        del self.memory_store[user_id]
-        return user
+        record = self.memory_store.pop(user_id)
+        self._unindex(record)
+        cls = type(self)
+        cls._tombstones += 1
+        if cls._tombstones > len(self.memory_store):
+            cls.sorted_ids = [i for i in self.sorted_ids if i in self.memory_store]
+            cls._tombstones = 0
+        return record.to_user()
 
-    def clear_all(self):
-        self.memory_store.clear()
+    def clear_all(self) -> None:
+        """Delete every user and restart the sequence."""
+        # Se reemplazan los contenedores (a nivel de clase, que es donde viven)
+        # en lugar de vaciarlos elemento a elemento
+        cls = type(self)
+        cls.memory_store = {}
+        cls.username_index = {}
+        cls.email_index = {}
+        cls.status_counts = {}
+        cls.sorted_ids = []
+        cls._tombstones = 0
         self._id_counter = 1
@@ -0,0 +1,194 @@
+from typing import AsyncIterator, List, Optional
+
+from sqlalchemy import func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from adapters.postgres.user_repository_adapter import COUNT_ESTIMATE_MIN_ROWS
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+from errors import UserAlreadyExistsError, UserNotFoundError
+
+
+class AsyncPostgresUserRepositoryAdapter(AsyncUserRepositoryPort):
+    """PostgreSQL implementation of AsyncUserRepository (SQLAlchemy asyncio).
+
+    The session must be created with ``expire_on_commit=False``: attributes
+    cannot be lazily reloaded outside of an awaited call.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create(self, user: User) -> User:
+        # Validación de username y email únicos
+        exists = await self.db.scalar(
+            select(User.id)
+            .where((User.username == user.username) | (User.email == user.email))
+            .limit(1)
+        )
+        if exists is not None:
+            raise UserAlreadyExistsError("Username or email already exists")
+        self.db.add(user)
+        await self.db.commit()
+        await self.db.refresh(user)
+        return user
+
+    async def create_many(self, users: List[User]) -> List[Optional[User]]:
+        # Una sola consulta de unicidad para todo el lote
+        taken = (
+            await self.db.execute(
+                select(User.username, User.email).where(
+                    or_(
+                        User.username.in_({u.username for u in users}),
+                        User.email.in_({u.email for u in users}),
+                    )
+                )
+            )
+        ).all()
+        usernames = {row.username for row in taken}
+        emails = {row.email for row in taken}
+        accepted = []
+        for user in users:
+            if user.username in usernames or user.email in emails:
+                continue
+            usernames.add(user.username)
+            emails.add(user.email)
+            accepted.append(user)
+        if accepted:
+            columns = [c.key for c in User.__table__.columns if c.key != "id"]
+            try:
+                ids = (
+                    await self.db.scalars(
+                        insert(User).returning(User.id, sort_by_parameter_order=True),
+                        [{c: getattr(u, c) for c in columns} for u in accepted],
+                    )
+                ).all()
+                await self.db.commit()
+            except IntegrityError:
+                # Otra petición ganó la carrera: se reintenta uno a uno
+                await self.db.rollback()
+                return [await self._create_or_none(u) for u in users]
+            for user, user_id in zip(accepted, ids):
+                user.id = user_id
+        accepted_ids = {id(u) for u in accepted}
+        return [u if id(u) in accepted_ids else None for u in users]
+
+    async def _create_or_none(self, user: User) -> Optional[User]:
+        try:
+            return await self.create(user)
+        except (UserAlreadyExistsError, IntegrityError):
+            await self.db.rollback()
+            return None
+
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        return await self.db.get(User, user_id)
+
+    async def get_by_username(self, username: str) -> Optional[User]:
+        return await self.db.scalar(select(User).where(User.username == username))
+
+    async def get_by_email(self, email: str) -> Optional[User]:
+        return await self.db.scalar(select(User).where(User.email == email))
+
+    async def get_all(self) -> List[User]:
+        return list(await self.db.scalars(select(User)))
+
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        # Keyset: rango sobre la llave primaria en lugar de OFFSET
+        query = select(User)
+        if cursor is not None:
+            query = query.where(User.id > cursor)
+        if status is not None:
+            query = query.where(User.status == status)
+        if username_prefix:
+            query = query.where(
+                User.username.startswith(username_prefix, autoescape=True)
+            )
+        return list(await self.db.scalars(query.order_by(User.id).limit(limit)))
+
+    async def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[User]:
+        # stream_scalars usa un cursor del lado del servidor
+        result = await self.db.stream_scalars(
+            select(User).order_by(User.id).execution_options(yield_per=chunk_size)
+        )
+        async for user in result:
+            yield user
+
+    async def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        postgres = self.db.get_bind().dialect.name == "postgresql"
+        if not exact and status is None and postgres:
+            # Estimación del planner: no recorre la tabla
+            estimate = await self.db.scalar(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": User.__tablename__},
+            )
+            # Sin ANALYZE reltuples vale 0 (antes de PG14) o -1; y en tablas
+            # chicas COUNT(*) es barato y exacto
+            if estimate is not None and estimate >= COUNT_ESTIMATE_MIN_ROWS:
+                return estimate
+        query = select(func.count(User.id))
+        if status is not None:
+            query = query.where(User.status == status)
+        return await self.db.scalar(query)
+
+    async def update(self, user: User) -> User:
+        db_user = await self.get_by_id(user.id)
+        if not db_user:
+            raise UserNotFoundError(f"User with id {user.id} not found")
+        if db_user is not user:
+            for column in User.__table__.columns:
+                setattr(db_user, column.key, getattr(user, column.key))
+        await self.db.commit()
+        await self.db.refresh(db_user)
+        return db_user
+
+    async def patch(self, user_id: int, fields: dict) -> User:
+        # Un solo UPDATE ... RETURNING: sin lectura previa ni refresh
+        try:
+            user = (
+                await self.db.scalars(
+                    update(User)
+                    .where(User.id == user_id)
+                    .values(**fields)
+                    .returning(User),
+                    execution_options={
+                        "synchronize_session": False,
+                        "populate_existing": True,
+                    },
+                )
+            ).one_or_none()
+        except IntegrityError:
+            await self.db.rollback()
+            raise UserAlreadyExistsError("Username or email already exists")
+        if user is None:
+            await self.db.rollback()
+            raise UserNotFoundError(f"User with id {user_id} not found")
+        await self.db.commit()
+        return user
+
+    async def delete(self, user_id: int) -> User:
+        db_user = await self.get_by_id(user_id)
+        if not db_user:
+            raise UserNotFoundError(f"User with id {user_id} not found")
+        await self.db.delete(db_user)
+        await self.db.commit()
+        return db_user
+
+    async def clear_all(self) -> None:
+        if self.db.get_bind().dialect.name == "postgresql":
+            # TRUNCATE libera las páginas de una vez en lugar de borrar fila a fila
+            await self.db.execute(
+                text(f"TRUNCATE TABLE {User.__tablename__} RESTART IDENTITY")
+            )
+        else:
+            await self.db.execute(User.__table__.delete())
+        await self.db.commit()
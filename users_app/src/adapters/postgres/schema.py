@@ -0,0 +1,9 @@
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from domain.models.user import Base
+
+
+async def create_schema(engine: AsyncEngine) -> None:
+    """Create the missing tables; existing ones are left untouched."""
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
@@ -1,12 +1,16 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from sqlalchemy import select
+from sqlalchemy import func, insert, or_, select, text, update
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import Session
 
 from domain.models.user import User
 from domain.ports.user_repository_port import UserRepositoryPort
 from errors import UserAlreadyExistsError, UserNotFoundError
 
+# Por debajo de esta estimación se cuenta con COUNT(*)
+COUNT_ESTIMATE_MIN_ROWS = 1000
+
 
 class PostgresUserRepositoryAdapter(UserRepositoryPort):
     """PostgreSQL implementation of UserRepository."""
@@ -16,9 +20,11 @@ class PostgresUserRepositoryAdapter(UserRepositoryPort):
 
     def create(self, user: User) -> User:
         # Validación de username y email únicos
-        exists = self.db.query(User).filter(
-            (User.username == user.username) | (User.email == user.email)
-        ).first()
+        exists = (
+            self.db.query(User)
+            .filter((User.username == user.username) | (User.email == user.email))
+            .first()
+        )
         if exists:
             raise UserAlreadyExistsError("Username or email already exists")
         self.db.add(user)
@@ -26,22 +32,136 @@ class PostgresUserRepositoryAdapter(UserRepositoryPort):
         self.db.refresh(user)
         return user
 
+    def create_many(self, users: List[User]) -> List[Optional[User]]:
+        # Una sola consulta de unicidad para todo el lote
+        taken = self.db.execute(
+            select(User.username, User.email).where(
+                or_(
+                    User.username.in_({u.username for u in users}),
+                    User.email.in_({u.email for u in users}),
+                )
+            )
+        ).all()
+        usernames = {row.username for row in taken}
+        emails = {row.email for row in taken}
+        accepted = []
+        for user in users:
+            if user.username in usernames or user.email in emails:
+                continue
+            usernames.add(user.username)
+            emails.add(user.email)
+            accepted.append(user)
+        if accepted:
+            columns = [c.key for c in User.__table__.columns if c.key != "id"]
+            try:
+                ids = self.db.scalars(
+                    insert(User).returning(User.id, sort_by_parameter_order=True),
+                    [{c: getattr(u, c) for c in columns} for u in accepted],
+                ).all()
+                self.db.commit()
+            except IntegrityError:
+                # Otra petición ganó la carrera: se reintenta uno a uno
+                self.db.rollback()
+                return [self._create_or_none(u) for u in users]
+            for user, user_id in zip(accepted, ids):
+                user.id = user_id
+        accepted_ids = {id(u) for u in accepted}
+        return [u if id(u) in accepted_ids else None for u in users]
+
+    def _create_or_none(self, user: User) -> Optional[User]:
+        try:
+            return self.create(user)
+        except (UserAlreadyExistsError, IntegrityError):
+            self.db.rollback()
+            return None
+
     def get_by_id(self, user_id: int) -> Optional[User]:
         return self.db.query(User).filter(User.id == user_id).first()
 
+    def get_by_username(self, username: str) -> Optional[User]:
+        return self.db.query(User).filter(User.username == username).first()
+
+    def get_by_email(self, email: str) -> Optional[User]:
+        return self.db.query(User).filter(User.email == email).first()
+
     def get_all(self) -> List[User]:
         return self.db.query(User).all()
 
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        # Keyset: rango sobre la llave primaria en lugar de OFFSET
+        query = self.db.query(User)
+        if cursor is not None:
+            query = query.filter(User.id > cursor)
+        if status is not None:
+            query = query.filter(User.status == status)
+        if username_prefix:
+            query = query.filter(
+                User.username.startswith(username_prefix, autoescape=True)
+            )
+        return query.order_by(User.id).limit(limit).all()
+
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[User]:
+        # yield_per usa un cursor del lado del servidor (stream_results)
+        return self.db.query(User).order_by(User.id).yield_per(chunk_size)
+
+    def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        postgres = self.db.get_bind().dialect.name == "postgresql"
+        if not exact and status is None and postgres:
+            # Estimación del planner: no recorre la tabla
+            estimate = self.db.execute(
+                text(
+                    "SELECT reltuples::bigint FROM pg_class "
+                    "WHERE oid = CAST(:table AS regclass)"
+                ),
+                {"table": User.__tablename__},
+            ).scalar()
+            # Sin ANALYZE reltuples vale 0 (antes de PG14) o -1; y en tablas
+            # chicas COUNT(*) es barato y exacto
+            if estimate is not None and estimate >= COUNT_ESTIMATE_MIN_ROWS:
+                return estimate
+        query = select(func.count(User.id))
+        if status is not None:
+            query = query.where(User.status == status)
+        return self.db.execute(query).scalar_one()
+
     def update(self, user: User) -> User:
         db_user = self.get_by_id(user.id)
         if not db_user:
             raise UserNotFoundError(f"User with id {user.id} not found")
-        for field, value in user.model_dump().items():
-            setattr(db_user, field, value)
+        if db_user is not user:
+            for column in User.__table__.columns:
+                setattr(db_user, column.key, getattr(user, column.key))
         self.db.commit()
         self.db.refresh(db_user)
         return db_user
 
+    def patch(self, user_id: int, fields: dict) -> User:
+        # Un solo UPDATE ... RETURNING: sin lectura previa ni refresh
+        try:
+            user = self.db.scalars(
+                update(User).where(User.id == user_id).values(**fields).returning(User),
+                execution_options={
+                    "synchronize_session": False,
+                    "populate_existing": True,
+                },
+            ).one_or_none()
+        except IntegrityError:
+            self.db.rollback()
+            raise UserAlreadyExistsError("Username or email already exists")
+        if user is None:
+            self.db.rollback()
+            raise UserNotFoundError(f"User with id {user_id} not found")
+        # Se separa de la sesión para que el commit no expire sus atributos
+        self.db.expunge(user)
+        self.db.commit()
+        return user
+
     def delete(self, user_id: int) -> User:
         db_user = self.get_by_id(user_id)
         if not db_user:
@@ -50,6 +170,12 @@ class PostgresUserRepositoryAdapter(UserRepositoryPort):
         self.db.commit()
         return db_user
 
-    def clear_all(self):
-        self.db.query(User).delete()
-        self.db.commit()
\ No newline at end of file
+    def clear_all(self) -> None:
+        if self.db.get_bind().dialect.name == "postgresql":
+            # TRUNCATE libera las páginas de una vez en lugar de borrar fila a fila
+            self.db.execute(
+                text(f"TRUNCATE TABLE {User.__tablename__} RESTART IDENTITY")
+            )
+        else:
+            self.db.query(User).delete()
+        self.db.commit()
@@ -0,0 +1,49 @@
+import base64
+import hashlib
+import hmac
+import time
+from typing import Optional
+
+from domain.ports.token_store_port import TokenStorePort
+
+
+class SignedTokenStoreAdapter(TokenStorePort):
+    """Stateless TokenStore: tokens carry the user ID and expiry, signed with HMAC.
+
+    Tokens have the form ``<user_id>.<expires_at>.<signature>`` where
+    ``expires_at`` is a Unix timestamp. Any worker or replica sharing the
+    secret can validate them without a shared session store.
+    """
+
+    def __init__(self, secret: str):
+        if not secret:
+            raise ValueError("A secret is required to sign tokens")
+        self._key = secret.encode("utf-8")
+
+    def issue(self, user_id: int, ttl_seconds: float) -> str:
+        """Issue a new token for the user."""
+        payload = f"{user_id}.{int(time.time() + ttl_seconds)}"
+        return f"{payload}.{self._sign(payload)}"
+
+    def resolve(self, token: str) -> Optional[int]:
+        """Get the user ID of a valid token, None if forged or expired."""
+        payload, _, signature = token.rpartition(".")
+        # compare_digest rechaza str con caracteres no ASCII: se comparan bytes
+        expected = self._sign(payload).encode("ascii")
+        if not hmac.compare_digest(signature.encode("utf-8"), expected):
+            return None
+        user_id, _, expires_at = payload.partition(".")
+        try:
+            if int(expires_at) <= time.time():
+                return None
+            return int(user_id)
+        except ValueError:
+            return None
+
+    def purge_expired(self, limit: Optional[int] = None) -> int:
+        """Nothing is stored, so nothing is purged."""
+        return 0
+
+    def _sign(self, payload: str) -> str:
+        digest = hmac.new(self._key, payload.encode("utf-8"), hashlib.sha256).digest()
+        return base64.urlsafe_b64encode(digest).rstrip(b"=").decode("ascii")
@@ -1,63 +1,194 @@
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+
+from fastapi import Depends
+
+from adapters.cache.user_repository_adapter import CachedUserRepository, LruTtlCache
+from adapters.instrumented.user_repository_adapter import InstrumentedUserRepository
+from adapters.memory.async_user_repository_adapter import (
+    AsyncInMemoryUserRepositoryAdapter,
+)
+from adapters.memory.token_store_adapter import InMemoryTokenStoreAdapter
 from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
-from adapters.postgres.user_repository_adapter import PostgresUserRepositoryAdapter
-from config.database import SessionLocal
+from adapters.postgres.async_user_repository_adapter import (
+    AsyncPostgresUserRepositoryAdapter,
+)
+from adapters.signed.token_store_adapter import SignedTokenStoreAdapter
+from config import Settings
+from config.database import get_session_factory
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+from domain.ports.token_store_port import TokenStorePort
 from domain.use_cases.authenticate_user_use_case import AuthenticateUserUseCase
 from domain.use_cases.base_use_case import BaseUseCase
+from domain.use_cases.bulk_create_users_use_case import BulkCreateUsersUseCase
 from domain.use_cases.count_users_use_case import CountUsersUseCase
 from domain.use_cases.create_user_use_case import CreateUserUseCase
 from domain.use_cases.delete_user_use_case import DeleteUserUseCase
+from domain.use_cases.export_users_use_case import ExportUsersUseCase
 from domain.use_cases.get_current_user_use_case import GetCurrentUserUseCase
 from domain.use_cases.get_user_use_case import GetUserUseCase
 from domain.use_cases.get_users_use_case import GetAllUsersUseCase
+from domain.use_cases.list_users_use_case import ListUsersUseCase
 from domain.use_cases.reset_users_use_case import ResetUsersUseCase
 from domain.use_cases.update_user_use_case import UpdateUserUseCase
 
-# Instancia única global
-user_repository = InMemoryUserRepositoryAdapter()
-auth_use_case = AuthenticateUserUseCase(user_repository)
 
-db_session = SessionLocal()
-repository = PostgresUserRepositoryAdapter(db_session)
+@lru_cache()
+def get_memory_user_repository() -> AsyncUserRepositoryPort:
+    """Get the in-memory repository, shared by every request."""
+    return InstrumentedUserRepository(
+        AsyncInMemoryUserRepositoryAdapter(InMemoryUserRepositoryAdapter()), "memory"
+    )
 
 
-def build_create_user_use_case() -> BaseUseCase:
+@lru_cache()
+def get_token_store() -> TokenStorePort:
+    """Get the session token store selected by TOKEN_MODE."""
+    if Settings.token_mode == "signed":
+        return SignedTokenStoreAdapter(Settings.token_secret)
+    return InMemoryTokenStoreAdapter(Settings.token_store_max_size)
+
+
+@lru_cache()
+def get_user_cache() -> Optional[LruTtlCache]:
+    """Get the read cache shared by every request, None when it is disabled."""
+    if not Settings.user_cache_enabled:
+        return None
+    return LruTtlCache(Settings.user_cache_max_size, Settings.user_cache_ttl_seconds)
+
+
+def with_user_cache(repository: AsyncUserRepositoryPort) -> AsyncUserRepositoryPort:
+    """Wrap the repository with the read-through cache when it is enabled."""
+    user_cache = get_user_cache()
+    if user_cache is None:
+        return repository
+    return CachedUserRepository(
+        repository, user_cache, Settings.user_cache_negative_ttl_seconds
+    )
+
+
+@asynccontextmanager
+async def open_user_repository() -> AsyncIterator[AsyncUserRepositoryPort]:
+    """Open the user repository, with its own DB session until the block ends."""
+    if Settings.users_backend != "postgres":
+        yield with_user_cache(get_memory_user_repository())
+        return
+    async with get_session_factory()() as db_session:
+        yield with_user_cache(
+            InstrumentedUserRepository(
+                AsyncPostgresUserRepositoryAdapter(db_session), "postgres"
+            )
+        )
+
+
+async def build_user_repository() -> AsyncIterator[AsyncUserRepositoryPort]:
+    """Get the user repository, with its own DB session per request.
+
+    Builders are ``async def`` so FastAPI resolves them on the event loop
+    instead of sending each one to the threadpool. Nothing is built at
+    import: the backend objects are created on the first request.
+    """
+    async with open_user_repository() as user_repository:
+        yield user_repository
+
+
+def build_token_store() -> TokenStorePort:
+    """Get the session token store."""
+    return get_token_store()
+
+
+async def build_create_user_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
     """Get create user use case."""
     return CreateUserUseCase(user_repository)
 
 
-def build_get_user_use_case() -> BaseUseCase:
+async def build_bulk_create_users_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
+    """Get bulk create users use case."""
+    return BulkCreateUsersUseCase(user_repository)
+
+
+async def build_get_user_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
     """Get user use case."""
     return GetUserUseCase(user_repository)
 
 
-def build_get_users_use_case() -> BaseUseCase:
+async def build_get_users_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
     """Get users use case."""
     return GetAllUsersUseCase(user_repository)
 
 
-def build_update_user_use_case() -> BaseUseCase:
+async def build_list_users_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
+    """List users use case."""
+    return ListUsersUseCase(user_repository)
+
+
+async def export_users() -> AsyncIterator[User]:
+    """Stream every user, in a DB session that lives as long as the stream."""
+    async with open_user_repository() as user_repository:
+        async for user in ExportUsersUseCase(user_repository).execute():
+            yield user
+
+
+async def build_export_users_stream() -> AsyncIterator[User]:
+    """Get the export stream, not started yet.
+
+    It does not depend on build_user_repository: FastAPI closes yield
+    dependencies before a StreamingResponse body runs, and the session
+    would go back to the pool (or leak) while the export still reads it.
+    """
+    return export_users()
+
+
+async def build_update_user_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
     """Update user use case."""
     return UpdateUserUseCase(user_repository)
 
 
-def build_delete_user_use_case() -> BaseUseCase:
+async def build_delete_user_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> BaseUseCase:
     """Get delete user use case."""
     return DeleteUserUseCase(user_repository)
 
 
-def build_authenticate_user_use_case() -> AuthenticateUserUseCase:
+async def build_authenticate_user_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> AuthenticateUserUseCase:
     """Get authenticate user use case."""
-    return auth_use_case  # devuelve la misma instancia
+    # Los tokens viven en token_store, compartido entre peticiones
+    return AuthenticateUserUseCase(
+        user_repository, get_token_store(), Settings.token_ttl_seconds
+    )
 
 
-def build_count_users_use_case() -> CountUsersUseCase:
+async def build_count_users_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> CountUsersUseCase:
     """Get count users use case."""
     return CountUsersUseCase(user_repository)
 
 
-def build_get_current_user_use_case() -> GetCurrentUserUseCase:
+async def build_get_current_user_use_case(
+    auth_use_case: AuthenticateUserUseCase = Depends(build_authenticate_user_use_case),
+) -> GetCurrentUserUseCase:
     return GetCurrentUserUseCase(auth_use_case)
 
 
-def build_reset_users_use_case() -> ResetUsersUseCase:
+async def build_reset_users_use_case(
+    user_repository: AsyncUserRepositoryPort = Depends(build_user_repository),
+) -> ResetUsersUseCase:
     return ResetUsersUseCase(user_repository)
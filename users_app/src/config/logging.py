@@ -0,0 +1,107 @@
+import json
+import logging
+import queue
+import random
+import sys
+from logging.handlers import QueueHandler, QueueListener
+from typing import Optional
+
+from config import Settings
+
+# Atributos propios de LogRecord; el resto viene de `extra` y se emite como campo
+_RECORD_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line, with the `extra` fields at the top level."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "msg": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and key != "sample":
+                entry[key] = value
+        if record.exc_info:
+            entry["exc"] = self.formatException(record.exc_info)
+        return json.dumps(entry, default=str, ensure_ascii=False)
+
+
+class SamplingFilter(logging.Filter):
+    """Keep only a fraction of the records logged with ``extra={"sample": True}``."""
+
+    def __init__(self, rate: float):
+        super().__init__()
+        self.rate = rate
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if not getattr(record, "sample", False) or self.rate >= 1:
+            return True
+        return random.random() < self.rate
+
+
+# Paquetes de la aplicación, cuyos logs sólo llevan valores inmutables
+APP_LOGGERS = ("adapters", "config", "domain", "entrypoints")
+
+
+class DeferredQueueHandler(QueueHandler):
+    """QueueHandler that leaves the formatting of the app's records to the listener.
+
+    Records of other loggers, and any record with exception info, are
+    formatted as usual before being queued: their args or traceback may
+    change or go away before the listener gets to them.
+    """
+
+    def __init__(self, queue, app_loggers=APP_LOGGERS):
+        super().__init__(queue)
+        self.app_loggers = frozenset(app_loggers)
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        if (
+            record.exc_info is None
+            and record.name.partition(".")[0] in self.app_loggers
+        ):
+            return record
+        return super().prepare(record)
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+
+
+def configure_logging() -> QueueListener:
+    """Route the root logger through a queue drained by a background thread.
+
+    Request handlers only enqueue records; formatting and the write to
+    stdout happen in the listener thread. Calling it again is a no-op.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        return _listener
+    log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+    queue_handler = DeferredQueueHandler(log_queue)
+    # El filtro va en el handler de la cola: lo descartado no se encola
+    queue_handler.addFilter(SamplingFilter(Settings.log_sample_rate))
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(JsonFormatter())
+
+    root = logging.getLogger()
+    root.setLevel(Settings.log_level.upper())
+    root.addHandler(queue_handler)
+    _queue_handler = queue_handler
+    _listener = QueueListener(log_queue, stream_handler)
+    _listener.start()
+    return _listener
+
+
+def shutdown_logging() -> None:
+    """Flush the queued records and stop the listener thread."""
+    global _listener, _queue_handler
+    if _listener is None:
+        return
+    logging.getLogger().removeHandler(_queue_handler)
+    _listener.stop()
+    _listener = _queue_handler = None
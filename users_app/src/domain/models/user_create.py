@@ -0,0 +1,15 @@
+from pydantic import BaseModel, ConfigDict, EmailStr
+
+
+class UserCreate(BaseModel):
+    """Fields and types of a new user, as accepted by POST /users/."""
+
+    model_config = ConfigDict(extra="forbid", strict=True)
+
+    username: str
+    password: str
+    email: EmailStr
+    dni: str
+    fullName: str
+    phoneNumber: str
+    status: str
@@ -0,0 +1,17 @@
+from typing import Optional
+
+from pydantic import BaseModel, ConfigDict
+
+
+class UserResponse(BaseModel):
+    """Public fields of a user: everything but the password."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    username: str
+    email: str
+    fullName: Optional[str] = None
+    dni: Optional[str] = None
+    phoneNumber: Optional[str] = None
+    status: str
@@ -0,0 +1,89 @@
+from abc import ABC, abstractmethod
+from typing import AsyncIterator, List, Optional
+
+from domain.models.user import User
+
+
+class AsyncUserRepositoryPort(ABC):
+    """Asynchronous user repository interface, mirrors UserRepositoryPort."""
+
+    @abstractmethod
+    async def create(self, user: User) -> User:
+        """Create a new user."""
+        pass
+
+    @abstractmethod
+    async def create_many(self, users: List[User]) -> List[Optional[User]]:
+        """Create a batch of users.
+
+        Returns a list aligned with `users`: the created user, or None when its
+        username or email is already taken (in the store or earlier in the batch).
+        """
+        pass
+
+    @abstractmethod
+    async def get_by_id(self, user_id: int) -> Optional[User]:
+        """Get user by ID."""
+        pass
+
+    @abstractmethod
+    async def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username."""
+        pass
+
+    @abstractmethod
+    async def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        pass
+
+    @abstractmethod
+    async def get_all(self) -> List[User]:
+        """Get all users."""
+        pass
+
+    @abstractmethod
+    async def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        """Get up to `limit` users with ID greater than `cursor`, ordered by ID."""
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[User]:
+        """Iterate over all users ordered by ID, loading `chunk_size` at a time."""
+        pass
+
+    @abstractmethod
+    async def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        """Count users, optionally only those with the given status.
+
+        With `exact=False` an adapter may return a cheaper estimate.
+        """
+        pass
+
+    @abstractmethod
+    async def update(self, user: User) -> User:
+        """Update an existing user."""
+        pass
+
+    @abstractmethod
+    async def patch(self, user_id: int, fields: dict) -> User:
+        """Set the given columns of a user and get the updated user.
+
+        Raises UserNotFoundError when there is no user with that ID.
+        """
+        pass
+
+    @abstractmethod
+    async def delete(self, user_id: int) -> User:
+        """Delete user."""
+        pass
+
+    @abstractmethod
+    async def clear_all(self) -> None:
+        """Delete every user and restart the ID sequence."""
+        pass
@@ -0,0 +1,21 @@
+from abc import ABC, abstractmethod
+from typing import Optional
+
+
+class TokenStorePort(ABC):
+    """Session token store interface."""
+
+    @abstractmethod
+    def issue(self, user_id: int, ttl_seconds: float) -> str:
+        """Issue a new token for the user."""
+        pass
+
+    @abstractmethod
+    def resolve(self, token: str) -> Optional[int]:
+        """Get the user ID of a valid token, None if unknown or expired."""
+        pass
+
+    @abstractmethod
+    def purge_expired(self, limit: Optional[int] = None) -> int:
+        """Remove expired tokens and return how many were removed."""
+        pass
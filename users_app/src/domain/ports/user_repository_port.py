@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from domain.models.user import User
 
@@ -12,22 +12,78 @@ class UserRepositoryPort(ABC):
         """Create a new user."""
         pass
 
+    @abstractmethod
+    def create_many(self, users: List[User]) -> List[Optional[User]]:
+        """Create a batch of users.
+
+        Returns a list aligned with `users`: the created user, or None when its
+        username or email is already taken (in the store or earlier in the batch).
+        """
+        pass
+
     @abstractmethod
     def get_by_id(self, user_id: int) -> Optional[User]:
         """Get user by ID."""
         pass
 
+    @abstractmethod
+    def get_by_username(self, username: str) -> Optional[User]:
+        """Get user by username."""
+        pass
+
+    @abstractmethod
+    def get_by_email(self, email: str) -> Optional[User]:
+        """Get user by email."""
+        pass
+
     @abstractmethod
     def get_all(self) -> List[User]:
         """Get all users."""
         pass
 
+    @abstractmethod
+    def get_page(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> List[User]:
+        """Get up to `limit` users with ID greater than `cursor`, ordered by ID."""
+        pass
+
+    @abstractmethod
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[User]:
+        """Iterate over all users ordered by ID, loading `chunk_size` at a time."""
+        pass
+
+    @abstractmethod
+    def count(self, status: Optional[str] = None, exact: bool = True) -> int:
+        """Count users, optionally only those with the given status.
+
+        With `exact=False` an adapter may return a cheaper estimate.
+        """
+        pass
+
     @abstractmethod
     def update(self, user: User) -> User:
         """Update an existing user."""
         pass
 
+    @abstractmethod
+    def patch(self, user_id: int, fields: dict) -> User:
+        """Set the given columns of a user and get the updated user.
+
+        Raises UserNotFoundError when there is no user with that ID.
+        """
+        pass
+
     @abstractmethod
     def delete(self, user_id: int) -> User:
         """Delete user."""
         pass
+
+    @abstractmethod
+    def clear_all(self) -> None:
+        """Delete every user and restart the ID sequence."""
+        pass
@@ -1,28 +1,34 @@
+import logging
 from datetime import datetime, timedelta
-from uuid import uuid4
 
 from domain.models.token_response import TokenResponse
-from domain.ports.user_repository_port import UserRepositoryPort
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+from domain.ports.token_store_port import TokenStorePort
 from errors import UserNotFoundError
 
+logger = logging.getLogger(__name__)
+
 
 class AuthenticateUserUseCase:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(
+        self,
+        user_repository: AsyncUserRepositoryPort,
+        token_store: TokenStorePort,
+        token_ttl_seconds: int = 3600,
+    ):
         self.user_repository = user_repository
-        self.tokens = {}
+        self.token_store = token_store
+        self.token_ttl_seconds = token_ttl_seconds
 
-    def execute(self, username: str, password: str) -> TokenResponse:
+    async def execute(self, username: str, password: str) -> TokenResponse:
         # Busca el usuario por username
-        users = self.user_repository.get_all()
-        user = next(
-            (u for u in users if u.username == username and u.password == password),
-            None,
-        )
-        if not user:
+        user = await self.user_repository.get_by_username(username)
+        if not user or user.password != password:
             raise UserNotFoundError("Usuario no encontrado")
-        token = str(uuid4())
-        expire_at = (datetime.utcnow() + timedelta(hours=1)).isoformat()
-        self.tokens[token] = {"user_id": user.id, "expire_at": expire_at}
-        print(f"Autenticando usuario: {user.username}, id: {user.id}")
-        print(f"Token generado: {token}, user_id guardado: {user.id}")
+        token = self.token_store.issue(user.id, self.token_ttl_seconds)
+        expire_at = (
+            datetime.utcnow() + timedelta(seconds=self.token_ttl_seconds)
+        ).isoformat()
+        # Nunca se registra el token
+        logger.debug("token issued", extra={"user_id": user.id, "sample": True})
         return TokenResponse(id=user.id, token=token, expireAt=expire_at)
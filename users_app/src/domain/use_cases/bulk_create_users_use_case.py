@@ -0,0 +1,21 @@
+from typing import List, Optional
+
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+from domain.use_cases.base_use_case import BaseUseCase
+
+
+class BulkCreateUsersUseCase(BaseUseCase):
+    """Use case for creating many users in chunked batches."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort, chunk_size: int = 500):
+        self.user_repository = user_repository
+        self.chunk_size = chunk_size
+
+    async def execute(self, users: List[User]) -> List[Optional[User]]:
+        """Create the users; None marks the ones rejected as duplicates."""
+        created = []
+        for start in range(0, len(users), self.chunk_size):
+            chunk = users[start : start + self.chunk_size]
+            created.extend(await self.user_repository.create_many(chunk))
+        return created
@@ -1,9 +1,11 @@
-from domain.ports.user_repository_port import UserRepositoryPort
+from typing import Optional
+
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
 
 
 class CountUsersUseCase:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
         self.user_repository = user_repository
 
-    def execute(self) -> int:
-        return len(self.user_repository.get_all())
+    async def execute(self, status: Optional[str] = None, exact: bool = True) -> int:
+        return await self.user_repository.count(status, exact)
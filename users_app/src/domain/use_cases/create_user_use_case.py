@@ -1,14 +1,14 @@
 from domain.models.user import User
-from domain.ports.user_repository_port import UserRepositoryPort
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
 from domain.use_cases.base_use_case import BaseUseCase
 
 
 class CreateUserUseCase(BaseUseCase):
     """Use case for saving a user."""
 
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
         self.user_repository = user_repository
 
-    def execute(self, user: User) -> User:
+    async def execute(self, user: User) -> User:
         """Create a new user."""
-        return self.user_repository.create(user)
+        return await self.user_repository.create(user)
@@ -1,13 +1,13 @@
 from domain.models.user import User
-from domain.ports.user_repository_port import UserRepositoryPort
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
 from domain.use_cases.base_use_case import BaseUseCase
 
 
 class DeleteUserUseCase(BaseUseCase):
     """Use case for deleting a user."""
 
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
         self.user_repository = user_repository
 
-    def execute(self, user_id: int) -> User:
-        return self.user_repository.delete(user_id)
+    async def execute(self, user_id: int) -> User:
+        return await self.user_repository.delete(user_id)
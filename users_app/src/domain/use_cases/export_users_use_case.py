@@ -0,0 +1,18 @@
+from typing import AsyncIterator
+
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+from domain.use_cases.base_use_case import BaseUseCase
+
+
+class ExportUsersUseCase(BaseUseCase):
+    """Use case for streaming every user."""
+
+    def __init__(
+        self, user_repository: AsyncUserRepositoryPort, chunk_size: int = 1000
+    ):
+        self.user_repository = user_repository
+        self.chunk_size = chunk_size
+
+    def execute(self) -> AsyncIterator[User]:
+        return self.user_repository.iter_all(self.chunk_size)
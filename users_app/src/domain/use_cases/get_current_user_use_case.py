@@ -1,26 +1,23 @@
-from datetime import datetime
+import logging
 
 from domain.use_cases.authenticate_user_use_case import AuthenticateUserUseCase
 from errors import UserNotFoundError
 
+logger = logging.getLogger(__name__)
+
 
 class GetCurrentUserUseCase:
     def __init__(self, auth_use_case: AuthenticateUserUseCase):
-        self.auth = auth_use_case  # contiene repository y tokens
-
-    def execute(self, token: str):
-        print(f"Buscando usuario por token: {token}")
-        data = self.auth.tokens.get(token)
-        if not data:
-            raise UserNotFoundError("Token inválido")
+        self.auth = auth_use_case  # contiene repository y token_store
 
-        print(f"Token data: {data}")
-        expire_at = datetime.fromisoformat(data["expire_at"])
-        if datetime.utcnow() > expire_at:
-            raise UserNotFoundError("Token expirado")
+    async def execute(self, token: str):
+        user_id = self.auth.token_store.resolve(token)
+        if user_id is None:
+            logger.debug("token rejected", extra={"sample": True})
+            raise UserNotFoundError("Token inválido o expirado")
 
-        print(f"Buscando usuario por id: {data['user_id']}")
-        user = self.auth.user_repository.get_by_id(data["user_id"])
+        logger.debug("token resolved", extra={"user_id": user_id, "sample": True})
+        user = await self.auth.user_repository.get_by_id(user_id)
         if not user:
             raise UserNotFoundError("Usuario no encontrado")
         return user
@@ -0,0 +1,26 @@
+from typing import List, Optional, Tuple
+
+from domain.models.user import User
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
+from domain.use_cases.base_use_case import BaseUseCase
+
+
+class ListUsersUseCase(BaseUseCase):
+    """Use case for listing users one page at a time."""
+
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
+        self.user_repository = user_repository
+
+    async def execute(
+        self,
+        limit: int,
+        cursor: Optional[int] = None,
+        status: Optional[str] = None,
+        username_prefix: Optional[str] = None,
+    ) -> Tuple[List[User], Optional[int]]:
+        """Get a page of users and the cursor of the next page, if any."""
+        users = await self.user_repository.get_page(
+            limit, cursor, status, username_prefix
+        )
+        next_cursor = users[-1].id if len(users) == limit else None
+        return users, next_cursor
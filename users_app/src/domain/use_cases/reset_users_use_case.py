@@ -1,13 +1,11 @@
-from domain.ports.user_repository_port import UserRepositoryPort
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
 
 
 class ResetUsersUseCase:
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
         self.user_repository = user_repository
 
-    def execute(self) -> dict:
-        # Sin acceder a atributos internos del adapter.
-        # Usamos únicamente el puerto: get_all + delete
-        for u in list(self.user_repository.get_all()):
-            self.user_repository.delete(u.id)
+    async def execute(self) -> dict:
+        # Una sola operación del puerto, sin recorrer los usuarios uno a uno
+        await self.user_repository.clear_all()
         return {"msg": "Todos los datos fueron eliminados"}
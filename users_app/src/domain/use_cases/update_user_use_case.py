@@ -1,19 +1,14 @@
 from domain.models.user import User
-from domain.ports.user_repository_port import UserRepositoryPort
+from domain.ports.async_user_repository_port import AsyncUserRepositoryPort
 from domain.use_cases.base_use_case import BaseUseCase
-from errors import UserNotFoundError
 
 
 class UpdateUserUseCase(BaseUseCase):
     """Use case for updating a user."""
 
-    def __init__(self, user_repository: UserRepositoryPort):
+    def __init__(self, user_repository: AsyncUserRepositoryPort):
         self.user_repository = user_repository
 
-    def execute(self, user_id: int, update_data: dict) -> None:
-        user = self.user_repository.get_by_id(user_id)
-        if not user:
-            raise UserNotFoundError("Usuario no encontrado")
-        for key, value in update_data.items():
-            setattr(user, key, value)
-        self.user_repository.update(user)
+    async def execute(self, user_id: int, update_data: dict) -> User:
+        # El repositorio detecta el usuario inexistente, sin leerlo antes
+        return await self.user_repository.patch(user_id, update_data)
@@ -0,0 +1,33 @@
+from typing import List, Tuple
+
+from pydantic import ValidationError
+
+from domain.models.user import User
+from domain.models.user_create import UserCreate
+
+
+def validate_bulk_items(items: list) -> Tuple[List[User], List[int], list]:
+    """Validate each item of a bulk create like a single create.
+
+    Returns the valid users, their positions in `items`, and the results
+    list with a 400 already filled in for every invalid item.
+    """
+    results = [None] * len(items)
+    users, positions = [], []
+    for index, item in enumerate(items):
+        try:
+            # Un valor mal tipado se rechaza aquí, no como DataError del lote
+            fields = UserCreate.model_validate(item)
+        except ValidationError as err:
+            results[index] = {
+                "index": index,
+                "status": 400,
+                "error": "Missing or invalid fields",
+                "details": err.errors(
+                    include_url=False, include_input=False, include_context=False
+                ),
+            }
+            continue
+        users.append(User(**fields.model_dump()))
+        positions.append(index)
+    return users, positions, results
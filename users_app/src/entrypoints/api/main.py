@@ -1,12 +1,87 @@
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from prometheus_client import REGISTRY
 
+from adapters.memory.token_store_adapter import InMemoryTokenStoreAdapter
+from adapters.postgres.schema import create_schema
+from assembly import build_token_store, get_user_cache
 from config import Settings
+from config.database import get_engine, pool_stats
+from config.logging import configure_logging, shutdown_logging
+from entrypoints.api.metrics import MetricsMiddleware, StatsCollector
+from entrypoints.api.metrics import router as metrics_router
+from entrypoints.api.profiling import ProfilingMiddleware
 from entrypoints.api.routers.user_router import router as user_router
 
-app = FastAPI(title=Settings.app_name)
+
+def register_stats_collectors(token_store) -> list:
+    """Export the saturation stats: connection pool, cache and tokens."""
+    collectors = []
+    if Settings.users_backend == "postgres":
+        collectors.append(
+            StatsCollector(
+                "users_db_pool", pool_stats, counters=("checkouts", "timeouts")
+            )
+        )
+    user_cache = get_user_cache()
+    if user_cache is not None:
+        collectors.append(
+            StatsCollector(
+                "users_cache",
+                user_cache.stats,
+                counters=("hits", "misses", "evictions"),
+            )
+        )
+    if isinstance(token_store, InMemoryTokenStoreAdapter):
+        collectors.append(
+            StatsCollector(
+                "users_token_store",
+                token_store.stats,
+                counters=("evictions", "lookups", "sweeps", "swept", "sweep_seconds"),
+            )
+        )
+    for collector in collectors:
+        REGISTRY.register(collector)
+    return collectors
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    configure_logging()
+    postgres = Settings.users_backend == "postgres"
+    if postgres and Settings.db_create_schema:
+        await create_schema(get_engine())
+    token_store = build_token_store()
+    collectors = register_stats_collectors(token_store)
+    # Los tokens firmados no guardan estado, no hay nada que barrer
+    sweeping = isinstance(token_store, InMemoryTokenStoreAdapter)
+    if sweeping:
+        token_store.start_sweeper(
+            Settings.token_sweep_interval_seconds, Settings.token_sweep_batch_size
+        )
+    yield
+    if sweeping:
+        token_store.stop_sweeper()
+    for collector in collectors:
+        REGISTRY.unregister(collector)
+    if postgres:
+        await get_engine().dispose()
+    shutdown_logging()
+
+
+app = FastAPI(title=Settings.app_name, lifespan=lifespan)
 app.include_router(user_router)
+app.include_router(metrics_router)
+app.add_middleware(MetricsMiddleware)
+if Settings.profiling_enabled:
+    app.add_middleware(
+        ProfilingMiddleware,
+        output_dir=Settings.profiling_dir,
+        token=Settings.profiling_token,
+    )
 
 
 @app.exception_handler(RequestValidationError)
@@ -0,0 +1,128 @@
+import time
+from typing import Callable, Iterable
+
+from anyio.to_thread import current_default_thread_limiter
+from fastapi import APIRouter, Response
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    REGISTRY,
+    Gauge,
+    Histogram,
+    generate_latest,
+)
+from prometheus_client.core import CounterMetricFamily, GaugeMetricFamily
+
+REQUEST_LATENCY = Histogram(
+    "http_request_duration_seconds",
+    "Latency of HTTP requests by route template.",
+    ["method", "route", "status"],
+)
+REQUESTS_IN_FLIGHT = Gauge(
+    "http_requests_in_flight", "HTTP requests currently being served."
+)
+
+
+class MetricsMiddleware:
+    """ASGI middleware that records request latency and in-flight requests.
+
+    The route label is the matched path template (``/users/{user_id}``),
+    never the raw path, so the number of series stays bounded.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status = 500
+
+        async def send_wrapper(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        REQUESTS_IN_FLIGHT.inc()
+        start = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            REQUESTS_IN_FLIGHT.dec()
+            # El router deja la ruta resuelta en el scope
+            route = scope.get("route")
+            REQUEST_LATENCY.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                status,
+            ).observe(time.perf_counter() - start)
+
+
+class ThreadpoolCollector:
+    """Utilization of the threadpool that runs the sync handlers.
+
+    It reads the anyio limiter of the running event loop, so it only reports
+    when collected from an ``async def`` handler.
+    """
+
+    def collect(self):
+        try:
+            limiter = current_default_thread_limiter()
+        except RuntimeError:  # fuera del event loop
+            return
+        statistics = limiter.statistics()
+        yield GaugeMetricFamily(
+            "threadpool_threads_max",
+            "Maximum threads of the threadpool.",
+            value=limiter.total_tokens,
+        )
+        yield GaugeMetricFamily(
+            "threadpool_threads_busy",
+            "Threads currently running a task.",
+            value=statistics.borrowed_tokens,
+        )
+        yield GaugeMetricFamily(
+            "threadpool_tasks_waiting",
+            "Tasks waiting for a free thread.",
+            value=statistics.tasks_waiting,
+        )
+
+
+class StatsCollector:
+    """Exposes the numeric entries of a ``stats()`` dict as metrics.
+
+    Keys listed in `counters` only grow and are exported as counters, the
+    rest as gauges: ``<prefix>_<key>``.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        stats: Callable[[], dict],
+        counters: Iterable[str] = (),
+    ):
+        self.prefix = prefix
+        self.stats = stats
+        self.counters = set(counters)
+
+    def collect(self):
+        for key, value in self.stats().items():
+            if not isinstance(value, (int, float)):
+                continue
+            name = f"{self.prefix}_{key}"
+            if key in self.counters:
+                yield CounterMetricFamily(name, f"{self.prefix} {key}.", value=value)
+            else:
+                yield GaugeMetricFamily(name, f"{self.prefix} {key}.", value=value)
+
+
+REGISTRY.register(ThreadpoolCollector())
+
+router = APIRouter()
+
+
+@router.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus scrape endpoint."""
+    return Response(generate_latest(REGISTRY), media_type=CONTENT_TYPE_LATEST)
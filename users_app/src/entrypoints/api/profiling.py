@@ -0,0 +1,124 @@
+import cProfile
+import os
+import pstats
+import threading
+import time
+from typing import Optional
+from uuid import uuid4
+
+from starlette.concurrency import run_in_threadpool
+
+PROFILE_HEADER = b"x-profile"
+
+# cProfile admite un solo perfil activo por proceso (en 3.12 el segundo
+# enable() falla; antes los dos perfiles se mezclaban)
+_profiling = threading.Lock()
+
+
+class ProfilingMiddleware:
+    """ASGI middleware that profiles the requests that ask for it.
+
+    A request is profiled when it carries an ``X-Profile`` header (equal to
+    `token`, when one is configured). It runs under cProfile until the
+    response starts; the response gets ``X-Profile-File`` and an
+    ``X-Profile-Summary`` with the functions that took the most time, and
+    the stats are written to `output_dir` as a ``.prof`` file (``python -m
+    pstats`` or snakeviz can read it) once the response is sent.
+
+    Only one request is profiled at a time: while a profile is running,
+    other requests that ask for one are served without it and get
+    ``X-Profile-Skipped: busy``.
+
+    cProfile follows the event loop thread: it sees the ``async def``
+    handlers, and anything else the loop runs meanwhile, but not the code
+    sent to the threadpool.
+    """
+
+    def __init__(self, app, output_dir: str, token: Optional[str] = None, top: int = 5):
+        self.app = app
+        self.output_dir = output_dir
+        self.token = token
+        self.top = top
+
+    def _requested(self, scope) -> bool:
+        for name, value in scope["headers"]:
+            if name == PROFILE_HEADER:
+                return not self.token or value.decode("latin-1") == self.token
+        return False
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or not self._requested(scope):
+            await self.app(scope, receive, send)
+            return
+        if not _profiling.acquire(blocking=False):
+            await self.app(scope, receive, self._skipped(send))
+            return
+        try:
+            await self._profile(scope, receive, send)
+        finally:
+            _profiling.release()
+
+    async def _profile(self, scope, receive, send):
+        profiler = cProfile.Profile()
+        start = time.perf_counter()
+        report = None
+
+        async def send_wrapper(message):
+            nonlocal report
+            if message["type"] == "http.response.start":
+                profiler.disable()
+                elapsed_ms = (time.perf_counter() - start) * 1000
+                report = self._report(scope, profiler, elapsed_ms)
+                message["headers"] = list(message.get("headers", [])) + report[2]
+            await send(message)
+
+        profiler.enable()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            profiler.disable()
+        if report is not None:
+            # La escritura a disco va al threadpool, después de la respuesta
+            stats, path, _ = report
+            await run_in_threadpool(self._dump, stats, path)
+
+    @staticmethod
+    def _skipped(send):
+        async def send_wrapper(message):
+            if message["type"] == "http.response.start":
+                message["headers"] = list(message.get("headers", [])) + [
+                    (b"x-profile-skipped", b"busy")
+                ]
+            await send(message)
+
+        return send_wrapper
+
+    def _dump(self, stats: pstats.Stats, path: str) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        stats.dump_stats(path)
+
+    def _report(self, scope, profiler: cProfile.Profile, elapsed_ms: float) -> tuple:
+        """Build the stats, the file path and the response headers."""
+        route = scope.get("route")
+        path = route.path if route is not None else scope["path"]
+        name = "{}-{}-{}{}.prof".format(
+            time.strftime("%Y%m%dT%H%M%S"),
+            uuid4().hex[:8],
+            scope["method"],
+            path.replace("/", "_").replace("{", "").replace("}", ""),
+        )
+        stats = pstats.Stats(profiler)
+
+        # Las funciones con más tiempo propio (sin contar sus llamadas)
+        entries = sorted(stats.stats.items(), key=lambda item: -item[1][2])
+        summary = [f"total={elapsed_ms:.1f}ms"]
+        for (filename, line, function), (_, calls, own, *_) in entries[: self.top]:
+            summary.append(
+                f"{os.path.basename(filename)}:{line}({function}) "
+                f"{own * 1000:.1f}ms/{calls}"
+            )
+        headers = [
+            (b"x-profile-file", name.encode("latin-1", "replace")),
+            (b"x-profile-summary", "; ".join(summary).encode("latin-1", "replace")),
+        ]
+        return stats, os.path.join(self.output_dir, name), headers
@@ -0,0 +1,57 @@
+import json
+from operator import attrgetter
+from typing import Any, Iterable, Tuple
+
+from fastapi.responses import JSONResponse
+
+from config import Settings
+from domain.models.user import User
+from domain.models.user_response import UserResponse
+
+try:
+    import orjson
+except ImportError:  # orjson es opcional
+    orjson = None
+
+# Campos públicos de un usuario (nunca la contraseña), los mismos que emite
+# response_model=UserResponse
+PUBLIC_USER_FIELDS: Tuple[str, ...] = tuple(UserResponse.model_fields)
+
+
+def dumps(content: Any) -> bytes:
+    """Encode content as compact JSON, with orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, ensure_ascii=False, separators=(",", ":")).encode()
+
+
+class FastJSONResponse(JSONResponse):
+    """JSONResponse rendered with orjson."""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
+
+
+class UserListSerializer:
+    """Serializer for lists of users built once for a fixed set of fields.
+
+    The users come from the repository, already validated, so they are read
+    with a precompiled attrgetter instead of going through response_model.
+    """
+
+    def __init__(self, fields: Tuple[str, ...] = PUBLIC_USER_FIELDS):
+        self.fields = fields
+        self._getter = attrgetter(*fields)
+
+    def to_dicts(self, users: Iterable[User]) -> list:
+        fields, getter = self.fields, self._getter
+        return [dict(zip(fields, getter(user))) for user in users]
+
+    def dumps(self, users: Iterable[User]) -> bytes:
+        return dumps(self.to_dicts(users))
+
+
+user_list_serializer = UserListSerializer()
+
+# Clase de respuesta de las rutas; FAST_JSON_RESPONSES=true activa orjson
+DefaultJSONResponse = FastJSONResponse if Settings.fast_json_responses else JSONResponse
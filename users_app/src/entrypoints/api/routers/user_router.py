@@ -1,30 +1,51 @@
+import json
 from datetime import datetime
-from typing import List
+from typing import AsyncIterator, List, Optional
 
-from fastapi import APIRouter, Body, Depends, Header, HTTPException
-from fastapi.responses import JSONResponse, PlainTextResponse
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+)
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 from pydantic import BaseModel
 
 from assembly import (
     build_authenticate_user_use_case,
+    build_bulk_create_users_use_case,
     build_count_users_use_case,
     build_create_user_use_case,
     build_delete_user_use_case,
+    build_export_users_stream,
     build_get_current_user_use_case,
     build_get_user_use_case,
-    build_get_users_use_case,
+    build_list_users_use_case,
     build_reset_users_use_case,
     build_update_user_use_case,
 )
+from config import Settings
 from domain.models.token_request import TokenRequest
 from domain.models.token_response import TokenResponse
 from domain.models.user import User
 from domain.models.user_patch import UserPatch
+from domain.models.user_response import UserResponse
 from domain.use_cases.authenticate_user_use_case import AuthenticateUserUseCase
 from domain.use_cases.base_use_case import BaseUseCase
+from entrypoints.api.bulk import validate_bulk_items
+from entrypoints.api.responses import (
+    PUBLIC_USER_FIELDS,
+    DefaultJSONResponse,
+    dumps,
+    user_list_serializer,
+)
 from errors import UserAlreadyExistsError, UserNotFoundError
 
-router = APIRouter(prefix="/users")
+router = APIRouter(prefix="/users", default_response_class=DefaultJSONResponse)
 
 
 @router.get("/ping", response_class=PlainTextResponse)
@@ -38,13 +59,29 @@ class CountResponse(BaseModel):
 
 
 @router.get("/count", response_model=CountResponse)
-def count_users(use_case=Depends(build_count_users_use_case)):
-    total = use_case.execute()
+async def count_users(
+    status: Optional[str] = None,
+    exact: bool = True,
+    use_case=Depends(build_count_users_use_case),
+):
+    total = await use_case.execute(status, exact)
     return {"count": total}
 
 
+@router.get("/export")
+async def export_users(users: AsyncIterator[User] = Depends(build_export_users_stream)):
+    """Stream every user as newline-delimited JSON."""
+
+    async def ndjson():
+        async for user in users:
+            yield dumps({field: getattr(user, field) for field in PUBLIC_USER_FIELDS})
+            yield b"\n"
+
+    return StreamingResponse(ndjson(), media_type="application/x-ndjson")
+
+
 @router.get("/me", response_model=User)
-def get_current_user(
+async def get_current_user(
     authorization: str = Header(None), use_case=Depends(build_get_current_user_use_case)
 ):
     if not authorization:
@@ -52,27 +89,26 @@ def get_current_user(
 
     token = authorization.replace("Bearer ", "")
     try:
-        user = use_case.execute(token)
-        print("Usuario retornado en /me:", user.id)
+        user = await use_case.execute(token)
         return user
     except UserNotFoundError as e:
         raise HTTPException(status_code=401, detail=str(e))
 
 
 @router.post("/reset")
-def reset_users(use_case=Depends(build_reset_users_use_case)):
-    return use_case.execute()
+async def reset_users(use_case=Depends(build_reset_users_use_case)):
+    return await use_case.execute()
 
 
 @router.post("/", response_model=User, status_code=201)
-def create_user(
+async def create_user(
     user: User, use_case: BaseUseCase = Depends(build_create_user_use_case)
 ):
     """Create a new user."""
     try:
-        created_user = use_case.execute(user)
+        created_user = await use_case.execute(user)
         created_at = datetime.utcnow()
-        return JSONResponse(
+        return DefaultJSONResponse(
             status_code=201,
             content={"id": created_user.id, "createdAt": created_at.isoformat()},
         )
@@ -82,23 +118,88 @@ def create_user(
         return JSONResponse({"error": str(err)}, status_code=404)
 
 
+MAX_BULK_ITEMS = 10000
+
+
+@router.post("/bulk")
+async def bulk_create_users(
+    request: Request,
+    use_case: BaseUseCase = Depends(build_bulk_create_users_use_case),
+):
+    """Create many users from a JSON array or an NDJSON body."""
+    raw = await request.body()
+    try:
+        if request.headers.get("content-type", "").startswith("application/x-ndjson"):
+            items = [json.loads(line) for line in raw.splitlines() if line.strip()]
+        else:
+            items = json.loads(raw)
+    except ValueError:
+        return JSONResponse(status_code=400, content={"error": "Invalid JSON"})
+    if not isinstance(items, list):
+        return JSONResponse(status_code=400, content={"error": "Expected a list"})
+    if len(items) > MAX_BULK_ITEMS:
+        return JSONResponse(
+            status_code=413,
+            content={"error": f"At most {MAX_BULK_ITEMS} users per request"},
+        )
+
+    users, positions, results = validate_bulk_items(items)
+
+    created = await use_case.execute(users)
+    created_at = datetime.utcnow().isoformat()
+    for index, user in zip(positions, created):
+        if user is None:
+            results[index] = {
+                "index": index,
+                "status": 412,
+                "error": "Username or email already exists",
+            }
+        else:
+            results[index] = {
+                "index": index,
+                "status": 201,
+                "id": user.id,
+                "createdAt": created_at,
+            }
+    return {"results": results}
+
+
 @router.get("/{user_id}", response_model=User)
-def get_user(user_id: int, use_case: BaseUseCase = Depends(build_get_user_use_case)):
+async def get_user(
+    user_id: int, use_case: BaseUseCase = Depends(build_get_user_use_case)
+):
     """Get a user by ID."""
-    user = use_case.execute(user_id)
+    user = await use_case.execute(user_id)
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
     return user
 
 
-@router.get("/", response_model=List[User])
-def get_users(use_case: BaseUseCase = Depends(build_get_users_use_case)):
-    """Get all users."""
-    return use_case.execute()
+@router.get("/", response_model=List[UserResponse])
+async def get_users(
+    response: Response,
+    limit: int = Query(100, ge=1, le=1000),
+    cursor: Optional[int] = Query(None, ge=0),
+    status: Optional[str] = None,
+    username: Optional[str] = Query(None, description="Username prefix"),
+    use_case: BaseUseCase = Depends(build_list_users_use_case),
+):
+    """Get a page of users; the next page cursor is sent in X-Next-Cursor."""
+    users, next_cursor = await use_case.execute(limit, cursor, status, username)
+    headers = {} if next_cursor is None else {"X-Next-Cursor": str(next_cursor)}
+    if Settings.fast_json_responses:
+        # Sin revalidar con response_model: los usuarios vienen del repositorio
+        return Response(
+            user_list_serializer.dumps(users),
+            media_type="application/json",
+            headers=headers,
+        )
+    response.headers.update(headers)
+    return users
 
 
 @router.put("/{user_id}", response_model=User)
-def update_user(
+async def update_user(
     user_id: int,
     user: User,
     use_case: BaseUseCase = Depends(build_update_user_use_case),
@@ -106,24 +207,24 @@ def update_user(
     """Update user."""
     try:
         user.id = user_id
-        return use_case.execute(user)
+        return await use_case.execute(user)
     except UserNotFoundError as err:
         return JSONResponse({"error": str(err)}, status_code=404)
 
 
 @router.delete("/{user_id}", response_model=User)
-def delete_user(
+async def delete_user(
     user_id: int, use_case: BaseUseCase = Depends(build_delete_user_use_case)
 ):
     """Delete user."""
     try:
-        return use_case.execute(user_id)
+        return await use_case.execute(user_id)
     except UserNotFoundError as err:
         return JSONResponse({"error": str(err)}, status_code=404)
 
 
 @router.patch("/{user_id}")
-def patch_user(
+async def patch_user(
     user_id: str,
     body: UserPatch = Body(...),
     use_case: BaseUseCase = Depends(build_update_user_use_case),
@@ -143,7 +244,7 @@ def patch_user(
             },
         )
     try:
-        use_case.execute(user_id_int, update_data)
+        await use_case.execute(user_id_int, update_data)
         return JSONResponse(
             status_code=200, content={"msg": "el usuario ha sido actualizado"}
         )
@@ -152,7 +253,7 @@ def patch_user(
 
 
 @router.post("/auth", response_model=TokenResponse)
-def generate_token(
+async def generate_token(
     body: TokenRequest,
     use_case: AuthenticateUserUseCase = Depends(build_authenticate_user_use_case),
 ):
@@ -161,7 +262,6 @@ def generate_token(
             status_code=400, content={"error": "Faltan campos requeridos"}
         )
     try:
-        return use_case.execute(body.username, body.password)
+        return await use_case.execute(body.username, body.password)
     except UserNotFoundError:
         return JSONResponse(status_code=404, content={"error": "Usuario no encontrado"})
-
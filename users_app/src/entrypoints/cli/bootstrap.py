@@ -0,0 +1,22 @@
+"""Create the database schema, e.g. from a deploy or migration job.
+
+Usage:
+    PYTHONPATH=src python -m entrypoints.cli.bootstrap
+"""
+
+import asyncio
+
+from adapters.postgres.schema import create_schema
+from config.database import get_engine
+
+
+async def main() -> None:
+    engine = get_engine()
+    try:
+        await create_schema(engine)
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
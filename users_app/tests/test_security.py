@@ -0,0 +1,18 @@
+import bcrypt
+
+from app.utils import security
+
+# Prueba de calibración: el costo queda dentro de los límites configurados
+def test_calibrate_rounds_within_bounds():
+    rounds = security.calibrate_rounds(target_ms=1, min_rounds=5, max_rounds=7)
+    assert rounds == 5
+
+    rounds = security.calibrate_rounds(target_ms=60_000, min_rounds=4, max_rounds=9)
+    assert rounds == 9
+
+# Prueba de detección de hashes con un costo desactualizado
+def test_needs_rehash(monkeypatch):
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 5)
+    hashed = security.hash_password("password123", bcrypt.gensalt(rounds=4))
+    assert security.needs_rehash(hashed)
+    assert not security.needs_rehash(security.hash_password("password123", security.get_salt()))
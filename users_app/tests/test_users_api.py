@@ -1,6 +1,16 @@
+import pytest
 from fastapi.testclient import TestClient
 from sqlalchemy.orm import Session
-from app import schemas
+from app import models, schemas
+from app.utils import security
+from app.main import app
+from app.routers import users as users_router
+from app.utils.hashing import hashing_pool
+from app.utils.sessions import SessionSweeper, purge_expired_sessions
+from sqlalchemy.orm import sessionmaker
+from datetime import datetime, timedelta
+import asyncio
+import logging
 import uuid
 
 # Prueba para el endpoint de salud /ping
@@ -95,3 +105,187 @@ def test_reset_database(client: TestClient):
     # Verificar que no hay usuarios
     count_after = client.get("/users/count").json()["count"]
     assert count_after == 0
+
+# Prueba de /me con tokens firmados (sin estado en la base de datos)
+def test_read_users_me_signed_token(client: TestClient, monkeypatch):
+    monkeypatch.setattr(security, "TOKEN_MODE", "signed")
+    monkeypatch.setattr(security, "TOKEN_SECRET", "test-secret")
+    token = test_login_for_token(client, None)
+    assert token.count(".") == 2
+
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+    assert response.json()["username"] == "loginuser"
+
+    forged = token[:-1] + ("A" if token[-1] != "A" else "B")
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {forged}"})
+    assert response.status_code == 401
+
+    # Un token con caracteres no ASCII se rechaza con 401, no con un 500
+    non_ascii = f"{token.rpartition('.')[0]}.firmañ".encode('latin-1')
+    response = client.get("/users/me", headers={"Authorization": b"Bearer " + non_ascii})
+    assert response.status_code == 401
+
+# Prueba de rechazo rápido cuando el pool de hashing está saturado
+def test_create_user_hashing_pool_saturated(client: TestClient, monkeypatch):
+    monkeypatch.setattr(hashing_pool, "max_pending", 0)
+    response = client.post(
+        "/users",
+        json={"username": "busyuser", "email": "busy@example.com", "password": "password123"}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+    assert hashing_pool.stats()["rejected"] >= 1
+
+# Prueba de rehash transparente cuando cambia el costo de bcrypt
+def test_login_rehashes_outdated_cost(client: TestClient, db_session: Session, monkeypatch):
+    # El rehash abre su propia sesión, sobre la base de datos de prueba
+    monkeypatch.setattr(users_router, "SessionLocal", sessionmaker(bind=db_session.get_bind()))
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 4)
+    test_login_for_token(client, db_session)
+    user = db_session.query(models.User).filter(models.User.username == "loginuser").one()
+    assert user.password.startswith("$2b$04$")
+
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 5)
+    response = client.post("/users/auth", json={"username": "loginuser", "password": "password123"})
+    assert response.status_code == 200
+
+    db_session.expire_all()
+    user = db_session.query(models.User).filter(models.User.username == "loginuser").one()
+    assert user.password.startswith("$2b$05$")
+    assert security.verify_password("password123", user.password, user.salt.encode('utf-8'))
+
+# Prueba de varias sesiones activas para el mismo usuario
+def test_each_login_opens_a_session(client: TestClient, db_session: Session):
+    first = test_login_for_token(client, db_session)
+    second = client.post("/users/auth", json={"username": "loginuser", "password": "password123"}).json()["token"]
+
+    for token in (first, second):
+        response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+        assert response.status_code == 200
+    # Sólo se guarda el hash del token
+    session = db_session.query(models.UserSession).filter(
+        models.UserSession.tokenHash == security.hash_token(first)
+    ).one()
+    assert session.tokenHash != first
+    assert db_session.query(models.UserSession).count() == 2
+
+# Prueba de purga de sesiones vencidas
+def test_purge_expired_sessions(client: TestClient, db_session: Session):
+    token = test_login_for_token(client, db_session)
+    user = db_session.query(models.User).filter(models.User.username == "loginuser").one()
+    expired_at = datetime.utcnow() - timedelta(minutes=1)
+    for _ in range(3):
+        db_session.add(models.UserSession(userId=user.id, tokenHash=uuid.uuid4().hex, expireAt=expired_at))
+    expired_token = client.post("/users/auth", json={"username": "loginuser", "password": "password123"}).json()["token"]
+    db_session.query(models.UserSession).filter(
+        models.UserSession.tokenHash == security.hash_token(expired_token)
+    ).update({"expireAt": expired_at})
+    db_session.commit()
+
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {expired_token}"})
+    assert response.status_code == 401
+
+    assert purge_expired_sessions(db_session, batch_size=2) == 4
+    assert db_session.query(models.UserSession).count() == 1
+    response = client.get("/users/me", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 200
+
+# Prueba de una pasada acotada del barrido de sesiones
+def test_session_sweeper_bounds_each_run(client: TestClient, db_session: Session):
+    test_login_for_token(client, db_session)
+    user = db_session.query(models.User).filter(models.User.username == "loginuser").one()
+    expired_at = datetime.utcnow() - timedelta(minutes=1)
+    for _ in range(5):
+        db_session.add(models.UserSession(userId=user.id, tokenHash=uuid.uuid4().hex, expireAt=expired_at))
+    db_session.commit()
+
+    sweeper = SessionSweeper(sessionmaker(bind=db_session.get_bind()), batch_size=2, max_batches=2)
+    assert sweeper.run_once() == 4
+    assert sweeper.run_once() == 1
+
+    body = client.get("/metrics").text
+    assert "session_sweep_duration_seconds_count" in body
+    assert "session_sweep_reclaimed_total" in body
+    stats = sweeper.stats()
+    assert stats["runs"] == 2
+    assert stats["reclaimed"] == 5
+    assert stats["last_reclaimed"] == 1
+    assert db_session.query(models.UserSession).count() == 1
+
+# Prueba de que las consultas de los handlers async no corren en el event loop
+def test_async_handlers_query_outside_event_loop(client: TestClient, monkeypatch):
+    loops = []
+
+    def recording(fn):
+        def wrapper(*args, **kwargs):
+            try:
+                loops.append(asyncio.get_running_loop())
+            except RuntimeError:
+                loops.append(None)
+            return fn(*args, **kwargs)
+        return wrapper
+
+    monkeypatch.setattr(users_router, "find_user", recording(users_router.find_user))
+    monkeypatch.setattr(users_router, "save", recording(users_router.save))
+    test_login_for_token(client, None)
+
+    assert len(loops) == 4  # create: find + save, login: find + save
+    assert loops == [None] * 4
+
+# Prueba de que un costo menor al del hash no lo rehashea hacia abajo
+def test_login_keeps_higher_cost(client: TestClient, db_session: Session, monkeypatch):
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 5)
+    test_login_for_token(client, db_session)
+
+    monkeypatch.setattr(security, "BCRYPT_ROUNDS", 4)
+    assert not security.needs_rehash(db_session.query(models.User).one().password)
+    response = client.post("/users/auth", json={"username": "loginuser", "password": "password123"})
+    assert response.status_code == 200
+
+    db_session.expire_all()
+    assert db_session.query(models.User).one().password.startswith("$2b$05$")
+
+# Prueba de que los fallos del barrido se cuentan y quedan en el log
+def test_session_sweeper_logs_failures(caplog):
+    class FailingSession:
+        def scalars(self, *args):
+            raise RuntimeError("base de datos caída")
+        def rollback(self):
+            pass
+        def close(self):
+            pass
+
+    sweeper = SessionSweeper(FailingSession, interval_seconds=0.01)
+
+    async def run():
+        sweeper.start()
+        await asyncio.sleep(0.1)
+        await sweeper.stop()
+
+    with caplog.at_level(logging.ERROR, logger="app.utils.sessions"):
+        asyncio.run(run())
+
+    assert sweeper.stats()["errors"] >= 1
+    assert "base de datos caída" in caplog.text
+    with pytest.raises(ValueError):
+        SessionSweeper(FailingSession, batch_size=0)
+
+# Prueba de que el modo firmado sin secreto no deja arrancar el servicio
+def test_signed_mode_without_secret_fails_at_startup(monkeypatch):
+    monkeypatch.setattr(security, "TOKEN_MODE", "signed")
+    monkeypatch.setattr(security, "TOKEN_SECRET", "")
+    with pytest.raises(RuntimeError, match="TOKEN_SECRET"):
+        with TestClient(app):
+            pass
+
+# Prueba de las métricas del pool de hashing en formato Prometheus
+def test_hashing_pool_metrics(client: TestClient):
+    test_login_for_token(client, None)
+
+    body = client.get("/metrics").text
+    assert "hashing_pool_queue_depth 0.0" in body
+    assert "hashing_pool_hash_seconds_count" in body
+    assert "hashing_pool_wait_seconds_count" in body
+    hashes = [line for line in body.splitlines() if line.startswith("hashing_pool_hash_seconds_count")]
+    assert float(hashes[0].split()[-1]) >= 2  # create + login
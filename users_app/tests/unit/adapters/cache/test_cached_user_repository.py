@@ -0,0 +1,99 @@
+import pytest
+
+from adapters.cache.user_repository_adapter import (
+    MISSING,
+    CachedUserRepository,
+    LruTtlCache,
+)
+from adapters.memory.async_user_repository_adapter import (
+    AsyncInMemoryUserRepositoryAdapter,
+)
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def inner():
+    repository = InMemoryUserRepositoryAdapter()
+    repository.clear_all()
+    yield AsyncInMemoryUserRepositoryAdapter(repository)
+    repository.clear_all()
+
+
+@pytest.fixture
+def repository(inner):
+    return CachedUserRepository(inner, LruTtlCache(max_size=2, ttl_seconds=60))
+
+
+def test_lru_evicts_least_recently_used():
+    """Test the bounded LRU order and the counters."""
+    cache = LruTtlCache(max_size=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is MISSING and cache.get("a") == 1
+    assert cache.stats() == {"size": 2, "hits": 2, "misses": 1, "evictions": 1}
+
+
+def test_ttl_expires_entries(mocker):
+    """Test that an entry is dropped once its TTL has passed."""
+    clock = mocker.patch("adapters.cache.user_repository_adapter.time.monotonic")
+    clock.return_value = 100.0
+    cache = LruTtlCache(ttl_seconds=10)
+    cache.set("a", 1)
+
+    clock.return_value = 111.0
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["size"] == 0
+
+
+async def test_get_by_id_is_read_through(repository, inner, valid_user_data, mocker):
+    """Test that repeated reads hit the wrapped repository once."""
+    user = await repository.create(User(**valid_user_data))
+    get_by_id = mocker.spy(inner, "get_by_id")
+
+    assert (await repository.get_by_id(user.id)).id == user.id
+    assert (await repository.get_by_id(user.id)).id == user.id
+    assert (await repository.get_by_username("testuser")).id == user.id
+
+    assert get_by_id.call_count == 1
+
+
+async def test_negative_results_are_invalidated_on_create(
+    repository, inner, valid_user_data, mocker
+):
+    """Test that a cached miss does not hide a user created afterwards."""
+    get_by_username = mocker.spy(inner, "get_by_username")
+
+    assert await repository.get_by_username("testuser") is None
+    assert await repository.get_by_username("testuser") is None
+    assert get_by_username.call_count == 1
+
+    await repository.create(User(**valid_user_data))
+    assert (await repository.get_by_username("testuser")).username == "testuser"
+
+
+async def test_update_and_delete_invalidate(repository, valid_user_data):
+    """Test that writes are visible to the next read."""
+    user = await repository.create(User(**valid_user_data))
+    await repository.get_by_username("testuser")
+
+    renamed = User(**{**valid_user_data, "username": "renamed"})
+    renamed.id = user.id
+    await repository.update(renamed)
+
+    assert await repository.get_by_username("testuser") is None
+    assert (await repository.get_by_id(user.id)).username == "renamed"
+
+    await repository.delete(user.id)
+    assert await repository.get_by_id(user.id) is None
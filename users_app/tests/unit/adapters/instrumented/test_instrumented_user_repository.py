@@ -0,0 +1,41 @@
+import pytest
+from prometheus_client import REGISTRY
+
+from adapters.instrumented.user_repository_adapter import InstrumentedUserRepository
+from adapters.memory.async_user_repository_adapter import (
+    AsyncInMemoryUserRepositoryAdapter,
+)
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+def observations(operation):
+    return REGISTRY.get_sample_value(
+        "users_repository_operation_seconds_count",
+        {"backend": "test", "operation": operation},
+    )
+
+
+async def test_operations_are_timed(valid_user_data):
+    """Test that each call and each full export is observed once."""
+    inner = InMemoryUserRepositoryAdapter()
+    inner.clear_all()
+    repository = InstrumentedUserRepository(
+        AsyncInMemoryUserRepositoryAdapter(inner), "test"
+    )
+    before = observations("get_by_id") or 0
+
+    user = await repository.create(User(**valid_user_data))
+    assert (await repository.get_by_id(user.id)).id == user.id
+    assert [u.id async for u in repository.iter_all()] == [user.id]
+
+    assert observations("get_by_id") == before + 1
+    assert observations("iter_all") >= 1
+    inner.clear_all()
@@ -0,0 +1,94 @@
+import time
+
+import pytest
+
+from adapters.memory.token_store_adapter import InMemoryTokenStoreAdapter
+
+
+def test_issue_and_resolve():
+    """Test resolving a live token."""
+    store = InMemoryTokenStoreAdapter()
+    token = store.issue(7, 60)
+
+    assert store.resolve(token) == 7
+    assert store.resolve("unknown") is None
+    assert store.stats()["lookups"] == 2
+
+
+def test_resolve_evicts_expired_token():
+    """Test that an expired token is removed on lookup."""
+    store = InMemoryTokenStoreAdapter()
+    token = store.issue(7, 0)
+
+    assert store.resolve(token) is None
+    assert store.stats()["size"] == 0
+    assert store.stats()["evictions"] == 1
+
+
+def test_purge_expired_respects_limit():
+    """Test purging expired tokens in bounded batches."""
+    store = InMemoryTokenStoreAdapter()
+    for user_id in range(5):
+        store.issue(user_id, 0)
+    live = store.issue(99, 60)
+
+    assert store.purge_expired(limit=3) == 3
+    assert store.purge_expired() == 2
+    assert store.stats()["size"] == 1
+    assert store.resolve(live) == 99
+
+
+def test_max_size_evicts_soonest_to_expire():
+    """Test that a full store drops the token closest to expiry."""
+    store = InMemoryTokenStoreAdapter(max_size=2)
+    first = store.issue(1, 10)
+    second = store.issue(2, 60)
+    third = store.issue(3, 60)
+
+    assert store.resolve(first) is None
+    assert store.resolve(second) == 2
+    assert store.resolve(third) == 3
+    assert store.stats()["size"] == 2
+
+
+def test_sweeper_purges_in_background():
+    """Test the background sweeper thread."""
+    store = InMemoryTokenStoreAdapter()
+    store.issue(1, 0)
+    store.start_sweeper(0.01)
+    try:
+        for _ in range(100):
+            if store.stats()["size"] == 0:
+                break
+            time.sleep(0.01)
+    finally:
+        store.stop_sweeper()
+
+    assert store.stats()["size"] == 0
+
+
+def test_sweep_purges_in_batches_and_records_stats():
+    """Test that a sweep removes every expired token and reports its cost."""
+    store = InMemoryTokenStoreAdapter()
+    for user_id in range(7):
+        store.issue(user_id, 0)
+    live = store.issue(99, 60)
+
+    assert store.sweep(batch_size=3) == 7
+
+    stats = store.stats()
+    assert stats["size"] == 1
+    assert stats["sweeps"] == 1
+    assert stats["swept"] == stats["last_swept"] == 7
+    assert stats["last_sweep_ms"] > 0
+    assert store.resolve(live) == 99
+
+
+def test_sweep_rejects_empty_batches():
+    """Test that a batch size below 1 is refused instead of looping forever."""
+    store = InMemoryTokenStoreAdapter()
+
+    with pytest.raises(ValueError):
+        store.sweep(batch_size=0)
+    with pytest.raises(ValueError):
+        store.start_sweeper(60, batch_size=0)
@@ -0,0 +1,225 @@
+import pytest
+from sqlalchemy import inspect
+
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+from errors import UserAlreadyExistsError, UserNotFoundError
+
+
+@pytest.fixture
+def repository():
+    repository = InMemoryUserRepositoryAdapter()
+    repository.clear_all()
+    yield repository
+    repository.clear_all()
+
+
+def test_create_rejects_duplicate_username(repository, valid_user_data):
+    """Test that a repeated username is rejected."""
+    repository.create(User(**valid_user_data))
+
+    with pytest.raises(UserAlreadyExistsError):
+        repository.create(User(**{**valid_user_data, "email": "other@example.com"}))
+
+
+def test_create_rejects_duplicate_email(repository, valid_user_data):
+    """Test that a repeated email is rejected."""
+    repository.create(User(**valid_user_data))
+
+    with pytest.raises(UserAlreadyExistsError):
+        repository.create(User(**{**valid_user_data, "username": "other"}))
+
+
+def test_get_by_username_and_email(repository, valid_user_data):
+    """Test lookups through the secondary indexes."""
+    user = repository.create(User(**valid_user_data))
+
+    assert repository.get_by_username("testuser").id == user.id
+    assert repository.get_by_email("testuser@example.com").id == user.id
+    assert repository.get_by_username("missing") is None
+    assert repository.get_by_email("missing@example.com") is None
+
+
+def test_update_reindexes_changed_keys(repository, valid_user_data):
+    """Test that update moves the index entries to the new keys."""
+    user = repository.create(User(**valid_user_data))
+    user.username = "renamed"
+    repository.update(user)
+
+    assert repository.get_by_username("testuser") is None
+    assert repository.get_by_username("renamed").id == user.id
+    repository.create(User(**{**valid_user_data, "email": "new@example.com"}))
+
+
+def test_update_rejects_keys_of_another_user(repository, valid_user_data):
+    """Test that update cannot steal another user's username."""
+    repository.create(User(**valid_user_data))
+    other = repository.create(
+        User(**{**valid_user_data, "username": "other", "email": "other@example.com"})
+    )
+    other.username = "testuser"
+
+    with pytest.raises(UserAlreadyExistsError):
+        repository.update(other)
+
+
+def test_delete_releases_keys(repository, valid_user_data):
+    """Test that deleted users free their username and email."""
+    user = repository.create(User(**valid_user_data))
+    repository.delete(user.id)
+
+    assert repository.get_by_username("testuser") is None
+    assert repository.create(User(**valid_user_data)).id == 2
+    with pytest.raises(UserNotFoundError):
+        repository.delete(user.id)
+
+
+def test_clear_all_resets_indexes(repository, valid_user_data):
+    """Test that clear_all empties the indexes and the sequence."""
+    repository.create(User(**valid_user_data))
+    repository.clear_all()
+
+    assert repository.get_by_email("testuser@example.com") is None
+    assert repository.create(User(**valid_user_data)).id == 1
+
+
+def test_get_page_walks_ids_after_cursor(repository, valid_user_data):
+    """Test keyset pagination with status and username prefix filters."""
+    for i in range(6):
+        repository.create(
+            User(
+                **{
+                    **valid_user_data,
+                    "username": f"{'ana' if i % 2 else 'bob'}{i}",
+                    "email": f"user{i}@example.com",
+                    "status": "VERIFICADO" if i < 4 else "POR_VERIFICAR",
+                }
+            )
+        )
+    repository.delete(2)
+
+    assert [u.id for u in repository.get_page(2)] == [1, 3]
+    assert [u.id for u in repository.get_page(2, cursor=3)] == [4, 5]
+    assert [u.id for u in repository.get_page(10, cursor=6)] == []
+    assert [u.id for u in repository.get_page(10, username_prefix="ana")] == [4, 6]
+    assert [u.id for u in repository.get_page(10, status="VERIFICADO")] == [1, 3, 4]
+
+
+def test_iter_all_yields_every_user_in_chunks(repository, valid_user_data):
+    """Test the chunked iterator used by the export."""
+    for i in range(5):
+        repository.create(
+            User(**{**valid_user_data, "username": f"u{i}", "email": f"u{i}@x.com"})
+        )
+
+    assert [u.id for u in repository.iter_all(chunk_size=2)] == [1, 2, 3, 4, 5]
+
+
+def test_create_many_marks_duplicates(repository, valid_user_data):
+    """Test that duplicates in the store or the batch come back as None."""
+    repository.create(User(**valid_user_data))
+    batch = [
+        User(**{**valid_user_data, "username": "a", "email": "a@x.com"}),
+        User(**valid_user_data),
+        User(**{**valid_user_data, "username": "a", "email": "b@x.com"}),
+    ]
+
+    created = repository.create_many(batch)
+
+    assert [u and u.id for u in created] == [2, None, None]
+
+
+def test_count_tracks_status_changes(repository, valid_user_data):
+    """Test the maintained total and per-status counters."""
+    first = repository.create(User(**valid_user_data))
+    repository.create(User(**{**valid_user_data, "username": "b", "email": "b@x.com"}))
+    first.status = "VERIFICADO"
+    repository.update(first)
+
+    assert repository.count() == 2
+    assert repository.count("POR_VERIFICAR") == 1
+    assert repository.count("VERIFICADO") == 1
+
+    repository.delete(first.id)
+
+    assert repository.count() == 1
+    assert repository.count("VERIFICADO") == 0
+
+
+def test_patch_reindexes_changed_fields(repository, valid_user_data):
+    """Test that a partial update keeps the indexes and counters in sync."""
+    user = repository.create(User(**valid_user_data))
+    repository.create(User(**{**valid_user_data, "username": "b", "email": "b@x.com"}))
+
+    patched = repository.patch(user.id, {"status": "VERIFICADO", "username": "c"})
+
+    assert patched.fullName == "Test User"
+    assert repository.get_by_username("c").id == user.id
+    assert repository.get_by_username("testuser") is None
+    assert repository.count("VERIFICADO") == 1
+    with pytest.raises(UserAlreadyExistsError):
+        repository.patch(user.id, {"username": "b"})
+    with pytest.raises(UserNotFoundError):
+        repository.patch(99, {"status": "VERIFICADO"})
+
+
+def test_returned_users_are_detached_copies(repository, valid_user_data):
+    """Test that the store only changes through the repository."""
+    user = repository.create(User(**valid_user_data))
+    user.fullName = "Changed"
+    fetched = repository.get_by_id(user.id)
+    fetched.status = "VERIFICADO"
+
+    stored = repository.get_by_id(user.id)
+    assert stored is not fetched
+    assert stored.fullName == "Test User"
+    assert stored.status == "POR_VERIFICAR"
+    assert repository.count("VERIFICADO") == 0
+
+
+def test_records_share_interned_status(repository, valid_user_data):
+    """Test that equal statuses are stored as one string."""
+    for i in range(2):
+        repository.create(
+            User(
+                **{
+                    **valid_user_data,
+                    "username": f"u{i}",
+                    "email": f"u{i}@x.com",
+                    "status": "".join(["POR_", "VERIFICAR"]),
+                }
+            )
+        )
+
+    first, second = repository.memory_store[1], repository.memory_store[2]
+    assert first.status is second.status
+    assert not hasattr(first, "__dict__")
+
+
+def test_returned_users_have_no_pending_changes(repository, valid_user_data):
+    """Test that materialized users look loaded, not modified."""
+    repository.create(User(**valid_user_data))
+
+    user = repository.get_by_id(1)
+    state = inspect(user)
+    assert user.username == "testuser"
+    assert not state.modified
+    assert not state.attrs.username.history.has_changes()
+
+
+def test_delete_compacts_the_sorted_ids(repository, valid_user_data):
+    """Test that deletes leave tombstones until they outnumber live users."""
+    for i in range(4):
+        repository.create(
+            User(**{**valid_user_data, "username": f"u{i}", "email": f"u{i}@x.com"})
+        )
+    repository.delete(2)
+    repository.delete(3)
+
+    assert repository.sorted_ids == [1, 2, 3, 4]
+    assert [u.id for u in repository.get_page(10)] == [1, 4]
+
+    repository.delete(4)
+
+    assert repository.sorted_ids == [1]
+    assert [u.id for u in repository.get_page(10, cursor=1)] == []
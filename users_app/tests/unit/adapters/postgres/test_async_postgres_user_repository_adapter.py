@@ -0,0 +1,94 @@
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from adapters.postgres.async_user_repository_adapter import (
+    AsyncPostgresUserRepositoryAdapter,
+)
+from domain.models.user import Base, User
+from errors import UserAlreadyExistsError, UserNotFoundError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def repository():
+    engine = create_async_engine("sqlite+aiosqlite://")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    session = async_sessionmaker(engine, autoflush=False, expire_on_commit=False)()
+    yield AsyncPostgresUserRepositoryAdapter(session)
+    await session.close()
+    await engine.dispose()
+
+
+def make_user(data, i):
+    return User(**{**data, "username": f"u{i}", "email": f"u{i}@x.com"})
+
+
+async def test_create_and_lookups(repository, valid_user_data):
+    """Test creating a user and reading it back after the commit."""
+    user = await repository.create(User(**valid_user_data))
+
+    assert user.username == "testuser"
+    assert (await repository.get_by_id(user.id)).id == user.id
+    assert (await repository.get_by_username("testuser")).id == user.id
+    assert (await repository.get_by_email("testuser@example.com")).id == user.id
+    with pytest.raises(UserAlreadyExistsError):
+        await repository.create(User(**valid_user_data))
+
+
+async def test_create_many_skips_duplicates(repository, valid_user_data):
+    """Test the batched insert."""
+    created = await repository.create_many(
+        [make_user(valid_user_data, 0), make_user(valid_user_data, 0)]
+        + [make_user(valid_user_data, 1)]
+    )
+
+    assert [u and u.id for u in created] == [1, None, 2]
+    assert await repository.count() == 2
+
+
+async def test_page_iter_and_count(repository, valid_user_data):
+    """Test keyset pages, the streamed iterator and the count."""
+    await repository.create_many([make_user(valid_user_data, i) for i in range(5)])
+
+    assert [u.id for u in await repository.get_page(2, cursor=2)] == [3, 4]
+    assert [u.id async for u in repository.iter_all(chunk_size=2)] == [1, 2, 3, 4, 5]
+    assert await repository.count(status="POR_VERIFICAR") == 5
+    assert await repository.count(exact=False) == 5
+
+
+async def test_update_delete_and_clear_all(repository, valid_user_data):
+    """Test the write operations."""
+    user = await repository.create(User(**valid_user_data))
+    user.fullName = "Otro Nombre"
+
+    assert (await repository.update(user)).fullName == "Otro Nombre"
+    assert (await repository.delete(user.id)).id == user.id
+    with pytest.raises(UserNotFoundError):
+        await repository.delete(user.id)
+
+    await repository.create_many([make_user(valid_user_data, i) for i in range(3)])
+    await repository.clear_all()
+    assert await repository.count() == 0
+
+
+async def test_patch_updates_without_a_prior_read(repository, valid_user_data):
+    """Test the UPDATE ... RETURNING partial update."""
+    user = await repository.create(User(**valid_user_data))
+
+    patched = await repository.patch(user.id, {"status": "VERIFICADO"})
+
+    assert (patched.id, patched.status, patched.username) == (
+        user.id,
+        "VERIFICADO",
+        "testuser",
+    )
+    assert await repository.count(status="VERIFICADO") == 1
+    with pytest.raises(UserNotFoundError):
+        await repository.patch(99, {"status": "VERIFICADO"})
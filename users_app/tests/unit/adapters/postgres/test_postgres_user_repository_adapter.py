@@ -0,0 +1,133 @@
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from adapters.postgres.user_repository_adapter import PostgresUserRepositoryAdapter
+from domain.models.user import Base, User
+from errors import UserNotFoundError
+
+
+@pytest.fixture
+def repository():
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(bind=engine)
+    session = sessionmaker(autocommit=False, autoflush=False, bind=engine)()
+    yield PostgresUserRepositoryAdapter(session)
+    session.close()
+    engine.dispose()
+
+
+def test_get_by_username_and_email(repository, valid_user_data):
+    """Test the indexed username and email lookups."""
+    user = repository.create(User(**valid_user_data))
+
+    assert repository.get_by_username("testuser").id == user.id
+    assert repository.get_by_email("testuser@example.com").id == user.id
+    assert repository.get_by_username("missing") is None
+    assert repository.get_by_email("missing@example.com") is None
+
+
+def test_get_page_filters_by_cursor_status_and_prefix(repository, valid_user_data):
+    """Test the keyset page query."""
+    for i, username in enumerate(["ana", "an_a", "bob", "anabel"]):
+        repository.create(
+            User(
+                **{
+                    **valid_user_data,
+                    "username": username,
+                    "email": f"user{i}@example.com",
+                    "status": "VERIFICADO" if i % 2 else "POR_VERIFICAR",
+                }
+            )
+        )
+
+    assert [u.id for u in repository.get_page(2)] == [1, 2]
+    assert [u.id for u in repository.get_page(2, cursor=2)] == [3, 4]
+    assert [u.username for u in repository.get_page(10, username_prefix="an_")] == [
+        "an_a"
+    ]
+    assert [u.id for u in repository.get_page(10, status="VERIFICADO")] == [2, 4]
+
+
+def test_iter_all_streams_ordered_rows(repository, valid_user_data):
+    """Test the yield_per iterator used by the export."""
+    for i in range(5):
+        repository.create(
+            User(**{**valid_user_data, "username": f"u{i}", "email": f"u{i}@x.com"})
+        )
+
+    assert [u.id for u in repository.iter_all(chunk_size=2)] == [1, 2, 3, 4, 5]
+
+
+def test_create_many_checks_batch_and_store(repository, valid_user_data):
+    """Test the single-query uniqueness check and batched insert."""
+    repository.create(User(**valid_user_data))
+    batch = [
+        User(**{**valid_user_data, "username": "a", "email": "a@x.com"}),
+        User(**valid_user_data),
+        User(**{**valid_user_data, "username": "b", "email": "a@x.com"}),
+        User(**{**valid_user_data, "username": "c", "email": "c@x.com"}),
+    ]
+
+    created = repository.create_many(batch)
+
+    assert [u and u.id for u in created] == [2, None, None, 3]
+    assert repository.get_by_username("c").email == "c@x.com"
+
+
+def test_clear_all_empties_table(repository, valid_user_data):
+    """Test clearing the table in one statement."""
+    repository.create(User(**valid_user_data))
+    repository.clear_all()
+
+    assert repository.get_all() == []
+
+
+def test_count_with_status_filter(repository, valid_user_data):
+    """Test the SQL COUNT, with and without a status filter."""
+    repository.create(User(**valid_user_data))
+    repository.create(
+        User(**{**valid_user_data, "username": "b", "email": "b@x.com", "status": "X"})
+    )
+
+    assert repository.count() == 2
+    assert repository.count(status="X") == 1
+    assert repository.count(exact=False) == 2
+
+
+@pytest.mark.parametrize("estimate", [-1, 0, 999])
+def test_count_estimate_falls_back_to_exact(estimate, mocker):
+    """Test that a missing or small planner estimate is not trusted."""
+    db = mocker.MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    db.execute.return_value.scalar.return_value = estimate
+    db.execute.return_value.scalar_one.return_value = 7
+
+    assert PostgresUserRepositoryAdapter(db).count(exact=False) == 7
+    assert db.execute.call_count == 2
+
+
+def test_count_uses_large_estimate(mocker):
+    """Test that a large planner estimate is returned without COUNT(*)."""
+    db = mocker.MagicMock()
+    db.get_bind.return_value.dialect.name = "postgresql"
+    db.execute.return_value.scalar.return_value = 50_000
+
+    assert PostgresUserRepositoryAdapter(db).count(exact=False) == 50_000
+    assert db.execute.call_count == 1
+
+
+def test_patch_is_a_single_update_returning(repository, valid_user_data):
+    """Test the partial update and the missing-row detection."""
+    user = repository.create(User(**valid_user_data))
+
+    patched = repository.patch(user.id, {"fullName": "Otro Nombre"})
+
+    assert (patched.id, patched.fullName, patched.dni) == (
+        user.id,
+        "Otro Nombre",
+        "12345678",
+    )
+    assert repository.get_by_id(user.id).fullName == "Otro Nombre"
+    with pytest.raises(UserNotFoundError):
+        repository.patch(99, {"fullName": "Nadie"})
@@ -0,0 +1,27 @@
+import pytest
+from sqlalchemy import inspect
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from adapters.postgres.schema import create_schema
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_create_schema_is_idempotent(tmp_path):
+    """Test that the schema is created once and a second run is a no-op."""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/schema.db")
+    try:
+        await create_schema(engine)
+        await create_schema(engine)
+        async with engine.connect() as connection:
+            tables = await connection.run_sync(
+                lambda sync: inspect(sync).get_table_names()
+            )
+    finally:
+        await engine.dispose()
+
+    assert "users" in tables
@@ -0,0 +1,44 @@
+import pytest
+
+from adapters.signed.token_store_adapter import SignedTokenStoreAdapter
+
+
+def test_issue_and_resolve():
+    """Test that a signed token resolves to its user."""
+    store = SignedTokenStoreAdapter("secret")
+    token = store.issue(42, 60)
+
+    assert store.resolve(token) == 42
+    assert SignedTokenStoreAdapter("secret").resolve(token) == 42
+
+
+def test_resolve_rejects_tampered_token():
+    """Test that changing the payload invalidates the signature."""
+    store = SignedTokenStoreAdapter("secret")
+    user_id, expires_at, signature = store.issue(42, 60).split(".")
+
+    assert store.resolve(f"43.{expires_at}.{signature}") is None
+    assert SignedTokenStoreAdapter("other").resolve(store.issue(42, 60)) is None
+    assert store.resolve("garbage") is None
+
+
+def test_resolve_rejects_expired_token():
+    """Test that an expired token is rejected."""
+    store = SignedTokenStoreAdapter("secret")
+
+    assert store.resolve(store.issue(42, -1)) is None
+
+
+def test_secret_is_required():
+    """Test that an empty secret is refused."""
+    with pytest.raises(ValueError):
+        SignedTokenStoreAdapter("")
+
+
+def test_resolve_rejects_non_ascii_token():
+    """Test that a non-ASCII signature is rejected instead of raising."""
+    store = SignedTokenStoreAdapter("secret")
+    payload = store.issue(42, 60).rpartition(".")[0]
+
+    assert store.resolve(f"{payload}.firmañ") is None
+    assert store.resolve("ñ.ñ.ñ") is None
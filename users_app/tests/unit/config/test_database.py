@@ -0,0 +1,58 @@
+import pytest
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from config.database import InstrumentedAsyncQueuePool, pool_metrics, pool_stats
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path}/pool.db",
+        poolclass=InstrumentedAsyncQueuePool,
+        pool_size=1,
+        max_overflow=0,
+        pool_timeout=0.01,
+    )
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_checkouts_and_timeouts_are_recorded(engine):
+    """Test that the pool records checkout waits and timeouts."""
+    checkouts, timeouts = pool_metrics.checkouts, pool_metrics.timeouts
+
+    connection = await engine.connect()
+    with pytest.raises(PoolTimeoutError):
+        await engine.connect()
+    await connection.close()
+
+    assert pool_metrics.checkouts == checkouts + 2
+    assert pool_metrics.timeouts == timeouts + 1
+    assert pool_metrics.max_wait_seconds >= 0.01
+
+
+def test_pool_stats_reports_saturation():
+    """Test the exported pool metrics."""
+    stats = pool_stats()
+
+    assert stats["checked_out"] == 0
+    assert stats["saturation"] == 0.0
+    assert set(stats) >= {"checkouts", "timeouts", "avg_wait_ms", "max_wait_ms"}
+
+
+def test_engine_is_built_on_first_use():
+    """Test that importing the module does not create the engine."""
+    from config.database import get_engine
+
+    get_engine.cache_clear()
+    assert get_engine.cache_info().currsize == 0
+
+    assert get_engine() is get_engine()
+    assert get_engine.cache_info().currsize == 1
@@ -0,0 +1,79 @@
+import json
+import logging
+import queue
+import sys
+
+from config.logging import (
+    DeferredQueueHandler,
+    JsonFormatter,
+    SamplingFilter,
+    configure_logging,
+    shutdown_logging,
+)
+
+
+def make_record(**extra):
+    record = logging.makeLogRecord({"name": "test", "levelname": "DEBUG"})
+    record.msg, record.args = "user %s", (7,)
+    record.__dict__.update(extra)
+    return record
+
+
+def test_json_formatter_emits_extra_fields():
+    """Test that `extra` fields come out as top-level JSON keys."""
+    entry = json.loads(JsonFormatter().format(make_record(user_id=7, sample=True)))
+
+    assert entry["msg"] == "user 7"
+    assert entry["user_id"] == 7
+    assert "sample" not in entry
+
+
+def test_sampling_filter_only_drops_sampled_records():
+    """Test that unsampled records always pass."""
+    sampling = SamplingFilter(0)
+
+    assert sampling.filter(make_record())
+    assert not sampling.filter(make_record(sample=True))
+
+
+def test_configure_logging_writes_through_the_queue(capsys):
+    """Test that records reach stdout once the listener is flushed."""
+    configure_logging()
+    try:
+        logging.getLogger("test").warning("hola %s", "mundo", extra={"user_id": 1})
+    finally:
+        shutdown_logging()
+
+    entry = json.loads(capsys.readouterr().out.strip().splitlines()[-1])
+    assert (entry["msg"], entry["user_id"]) == ("hola mundo", 1)
+
+
+def test_queue_handler_only_defers_app_records():
+    """Test that foreign records are formatted before they are queued."""
+    handler = DeferredQueueHandler(queue.SimpleQueue())
+    app_record = make_record(name="domain.use_cases.x")
+    args = ["antes"]
+    foreign = make_record(name="uvicorn.error")
+    foreign.msg, foreign.args = "valor %s", (args,)
+
+    assert handler.prepare(app_record) is app_record
+    prepared = handler.prepare(foreign)
+    args.append("después")
+
+    assert prepared.getMessage() == "valor ['antes']"
+    assert prepared.args is None
+
+
+def test_queue_handler_formats_app_records_with_exceptions():
+    """Test that exception info is never left for the listener."""
+    handler = DeferredQueueHandler(queue.SimpleQueue())
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        record = make_record(name="domain.x", exc_info=sys.exc_info())
+
+    prepared = handler.prepare(record)
+
+    assert prepared is not record
+    assert prepared.exc_info is None
+    assert "ValueError: boom" in prepared.getMessage()
@@ -0,0 +1,54 @@
+import pytest
+
+from adapters.memory.async_user_repository_adapter import (
+    AsyncInMemoryUserRepositoryAdapter,
+)
+from adapters.memory.token_store_adapter import InMemoryTokenStoreAdapter
+from adapters.memory.user_repository_adapter import InMemoryUserRepositoryAdapter
+from domain.models.user import User
+from domain.use_cases.authenticate_user_use_case import AuthenticateUserUseCase
+from errors import UserNotFoundError
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+def repository(valid_user_data):
+    repository = InMemoryUserRepositoryAdapter()
+    repository.clear_all()
+    repository.create(User(**valid_user_data))
+    yield AsyncInMemoryUserRepositoryAdapter(repository)
+    repository.clear_all()
+
+
+@pytest.fixture
+def use_case(repository):
+    return AuthenticateUserUseCase(repository, InMemoryTokenStoreAdapter())
+
+
+async def test_authenticate_looks_up_by_username(repository, use_case, mocker):
+    """Test that authentication does not list every user."""
+    get_all = mocker.spy(repository, "get_all")
+
+    response = await use_case.execute("testuser", "password123")
+
+    assert response.id == 1
+    assert use_case.token_store.resolve(response.token) == 1
+    get_all.assert_not_called()
+
+
+async def test_authenticate_unknown_username(use_case):
+    """Test authenticating an unknown username."""
+    with pytest.raises(UserNotFoundError):
+        await use_case.execute("nouser", "password123")
+
+
+async def test_authenticate_wrong_password(use_case):
+    """Test authenticating with a wrong password."""
+    with pytest.raises(UserNotFoundError):
+        await use_case.execute("testuser", "wrong")
@@ -0,0 +1,21 @@
+import pytest
+
+from domain.use_cases.reset_users_use_case import ResetUsersUseCase
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.mark.anyio
+async def test_reset_uses_clear_all(mocker):
+    """Test that reset is a single repository call."""
+    repository = mocker.AsyncMock()
+
+    result = await ResetUsersUseCase(repository).execute()
+
+    repository.clear_all.assert_awaited_once_with()
+    repository.get_all.assert_not_called()
+    repository.delete.assert_not_called()
+    assert result == {"msg": "Todos los datos fueron eliminados"}
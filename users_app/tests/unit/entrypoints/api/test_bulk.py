@@ -0,0 +1,27 @@
+from entrypoints.api.bulk import validate_bulk_items
+
+
+def test_validate_bulk_items_rejects_only_the_mistyped_item(valid_user_data):
+    """Test that a mistyped item gets its own 400 and the rest are kept."""
+    second = dict(valid_user_data, username="other", email="other@example.com")
+    mistyped = dict(valid_user_data, username="third", phoneNumber=5551234)
+
+    users, positions, results = validate_bulk_items([valid_user_data, mistyped, second])
+
+    assert positions == [0, 2]
+    assert [user.username for user in users] == [valid_user_data["username"], "other"]
+    assert results[0] is None and results[2] is None
+    assert results[1]["status"] == 400
+    assert results[1]["details"][0]["loc"] == ("phoneNumber",)
+
+
+def test_validate_bulk_items_rejects_missing_extra_and_bad_email(valid_user_data):
+    """Test missing fields, unknown fields, bad emails and non-objects."""
+    missing = {k: v for k, v in valid_user_data.items() if k != "dni"}
+    extra = dict(valid_user_data, id=7)
+    bad_email = dict(valid_user_data, email="not-an-email")
+
+    users, positions, results = validate_bulk_items([missing, extra, bad_email, "user"])
+
+    assert users == [] and positions == []
+    assert [result["status"] for result in results] == [400] * 4
@@ -0,0 +1,40 @@
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from prometheus_client import CollectorRegistry, generate_latest
+
+from entrypoints.api.metrics import MetricsMiddleware, StatsCollector
+from entrypoints.api.metrics import router as metrics_router
+
+
+def test_metrics_endpoint_labels_requests_by_route_template():
+    """Test the latency histogram, the in-flight gauge and the threadpool."""
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    def get_item(item_id: int):
+        return {"id": item_id}
+
+    app.include_router(metrics_router)
+    app.add_middleware(MetricsMiddleware)
+    client = TestClient(app)
+    client.get("/items/42")
+
+    body = client.get("/metrics").text
+
+    assert 'route="/items/{item_id}",status="200"' in body
+    assert 'route="/items/42"' not in body
+    assert "http_requests_in_flight" in body
+    assert "threadpool_threads_busy" in body
+
+
+def test_stats_collector_exports_counters_and_gauges():
+    """Test that stats() entries become metrics."""
+    registry = CollectorRegistry()
+    registry.register(
+        StatsCollector("cache", lambda: {"size": 3, "hits": 5}, counters=("hits",))
+    )
+
+    body = generate_latest(registry).decode()
+
+    assert "cache_size 3.0" in body
+    assert "cache_hits_total 5.0" in body
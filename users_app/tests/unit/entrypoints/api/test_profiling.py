@@ -0,0 +1,81 @@
+import asyncio
+import pstats
+
+import anyio
+import httpx
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from entrypoints.api.profiling import ProfilingMiddleware
+
+
+def build_client(output_dir, token=None):
+    app = FastAPI()
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        return {"id": sum(range(item_id))}
+
+    app.add_middleware(ProfilingMiddleware, output_dir=str(output_dir), token=token)
+    return TestClient(app)
+
+
+def test_only_requests_with_the_header_are_profiled(tmp_path):
+    """Test that profiling is opt-in per request."""
+    client = build_client(tmp_path)
+
+    response = client.get("/items/1000")
+
+    assert response.json() == {"id": 499500}
+    assert "x-profile-summary" not in response.headers
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_profile_is_written_and_summarized(tmp_path):
+    """Test the profile file and the summary header."""
+    client = build_client(tmp_path, token="secreto")
+
+    response = client.get("/items/1000", headers={"X-Profile": "secreto"})
+
+    assert response.headers["x-profile-summary"].startswith("total=")
+    profile = tmp_path / response.headers["x-profile-file"]
+    assert "items_item_id" in profile.name
+    assert pstats.Stats(str(profile)).total_calls > 0
+
+
+def test_wrong_token_is_not_profiled(tmp_path):
+    """Test that a configured token is required."""
+    client = build_client(tmp_path, token="secreto")
+
+    response = client.get("/items/1", headers={"X-Profile": "otro"})
+
+    assert "x-profile-file" not in response.headers
+
+
+def test_concurrent_profiles_are_skipped(tmp_path):
+    """Test that a second profiled request is served without profiling."""
+    app = FastAPI()
+
+    @app.get("/slow")
+    async def slow():
+        await anyio.sleep(0.05)
+        return {"ok": True}
+
+    app.add_middleware(ProfilingMiddleware, output_dir=str(tmp_path))
+
+    async def run():
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport, base_url="http://t"
+        ) as client:
+            return await asyncio.gather(
+                *(client.get("/slow", headers={"X-Profile": "1"}) for _ in range(2))
+            )
+
+    responses = asyncio.run(run())
+
+    assert [r.status_code for r in responses] == [200, 200]
+    profiled = [r for r in responses if "x-profile-file" in r.headers]
+    skipped = [r for r in responses if r.headers.get("x-profile-skipped") == "busy"]
+    assert len(profiled) == len(skipped) == 1
+    assert (tmp_path / profiled[0].headers["x-profile-file"]).exists()
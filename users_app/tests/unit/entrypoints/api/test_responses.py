@@ -0,0 +1,53 @@
+import json
+from typing import List
+
+from fastapi import FastAPI, Response
+from fastapi.testclient import TestClient
+
+from domain.models.user import User
+from domain.models.user_response import UserResponse
+from entrypoints.api.responses import (
+    PUBLIC_USER_FIELDS,
+    FastJSONResponse,
+    user_list_serializer,
+)
+
+
+def test_user_list_serializer_skips_the_password(user_with_id):
+    """Test that the precompiled serializer only emits the public fields."""
+    body = user_list_serializer.dumps([User(**user_with_id)])
+
+    assert json.loads(body) == [
+        {k: v for k, v in user_with_id.items() if k != "password"}
+    ]
+
+
+def test_fast_json_response_renders_compact_json():
+    """Test the orjson response class."""
+    response = FastJSONResponse({"id": 1, "fullName": "Ñandú"})
+
+    assert json.loads(response.body) == {"id": 1, "fullName": "Ñandú"}
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_fast_path_body_matches_response_model(user_with_id):
+    """Test that FAST_JSON_RESPONSES does not change the list body."""
+    users = [User(**user_with_id), User(**{**user_with_id, "id": 2, "dni": None})]
+    app = FastAPI()
+
+    @app.get("/default", response_model=List[UserResponse])
+    async def default_route():
+        return users
+
+    @app.get("/fast")
+    async def fast_route():
+        return Response(
+            user_list_serializer.dumps(users), media_type="application/json"
+        )
+
+    client = TestClient(app)
+    default_body = client.get("/default").json()
+
+    assert json.loads(client.get("/fast").content) == default_body
+    assert "password" not in default_body[0]
+    assert PUBLIC_USER_FIELDS == tuple(default_body[0])
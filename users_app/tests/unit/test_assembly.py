@@ -0,0 +1,66 @@
+import pytest
+from fastapi import Depends, FastAPI
+from fastapi.responses import StreamingResponse
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import AsyncAdaptedQueuePool
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import assembly
+from domain.models.user import Base, User
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def engine(mocker, tmp_path, valid_user_data):
+    engine = create_async_engine(
+        f"sqlite+aiosqlite:///{tmp_path / 'users.db'}",
+        poolclass=AsyncAdaptedQueuePool,
+    )
+    async with engine.begin() as connection:
+        await connection.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        for i in range(3):
+            session.add(
+                User(
+                    **{
+                        **valid_user_data,
+                        "username": f"user{i}",
+                        "email": f"user{i}@example.com",
+                    }
+                )
+            )
+        await session.commit()
+
+    mocker.patch.object(assembly, "Settings", mocker.Mock(users_backend="postgres"))
+    mocker.patch.object(assembly, "get_user_cache", return_value=None)
+    mocker.patch.object(assembly, "get_session_factory", return_value=factory)
+    yield engine
+    await engine.dispose()
+
+
+@pytest.mark.anyio
+async def test_export_stream_returns_its_connection_to_the_pool(engine):
+    """Test that the export session is closed once the response is sent."""
+    app = FastAPI()
+
+    @app.get("/export")
+    async def export(users=Depends(assembly.build_export_users_stream)):
+        async def lines():
+            async for user in users:
+                # La sesión es del stream, no de la dependencia
+                assert engine.pool.checkedout() == 1
+                yield f"{user.username}\n"
+
+        return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/export")
+
+    assert response.text.split() == ["user0", "user1", "user2"]
+    assert engine.pool.checkedout() == 0